@@ -195,6 +195,43 @@ class RedisCache:
             logger.warning("redis_set_failed", key=key, error=str(e))
             return False
 
+    async def set_if_absent(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+    ) -> Optional[bool]:
+        """
+        Set value only if the key does not already exist (SET NX EX).
+
+        Args:
+            key: Cache key
+            value: Value to store (will be JSON serialized if dict/list)
+            ttl: Time-to-live in seconds (defaults to settings.redis.ttl)
+
+        Returns:
+            True if the key was set, False if it already existed, None on error
+        """
+        if not self.client:
+            await self.connect()
+
+        try:
+            if isinstance(value, (dict, list)):
+                serialized = json.dumps(value)
+            else:
+                serialized = str(value)
+
+            ttl = ttl or settings.redis.ttl
+
+            result = await self.client.set(key, serialized, ex=ttl, nx=True)
+
+            logger.debug("redis_cache_set_if_absent", key=key, ttl=ttl, created=bool(result))
+            return bool(result)
+
+        except (RedisError, TimeoutError) as e:
+            logger.warning("redis_set_if_absent_failed", key=key, error=str(e))
+            return None
+
     async def delete(self, key: str) -> bool:
         """
         Delete key from cache.
@@ -0,0 +1,34 @@
+"""add repository lookup covering index
+
+Revision ID: 3f9c2a7d1e4b
+Revises: c650339a189b
+Create Date: 2026-10-17 09:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d1e4b'
+down_revision: Union[str, Sequence[str], None] = 'c650339a189b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('repository_connections', schema=None) as batch_op:
+        batch_op.create_index(
+            'idx_repo_provider_full_name_covering',
+            ['provider', 'repository_full_name'],
+            unique=False,
+            postgresql_include=['id', 'user_id', 'webhook_secret', 'is_enabled', 'auto_pr_enabled'],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('repository_connections', schema=None) as batch_op:
+        batch_op.drop_index('idx_repo_provider_full_name_covering')
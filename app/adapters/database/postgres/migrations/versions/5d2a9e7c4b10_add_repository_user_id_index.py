@@ -0,0 +1,29 @@
+"""add repository user id index
+
+Revision ID: 5d2a9e7c4b10
+Revises: 8b1e6d4c2a93
+Create Date: 2026-10-17 13:42:08.614392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a9e7c4b10'
+down_revision: Union[str, Sequence[str], None] = '8b1e6d4c2a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('repository_connections', schema=None) as batch_op:
+        batch_op.create_index('idx_repo_user_id', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('repository_connections', schema=None) as batch_op:
+        batch_op.drop_index('idx_repo_user_id')
@@ -0,0 +1,34 @@
+"""add workflow run keyset index
+
+Revision ID: 8b1e6d4c2a93
+Revises: 3f9c2a7d1e4b
+Create Date: 2026-10-17 11:04:27.306915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1e6d4c2a93'
+down_revision: Union[str, Sequence[str], None] = '3f9c2a7d1e4b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('workflow_runs', schema=None) as batch_op:
+        batch_op.create_index(
+            'idx_wfrun_repo_created_id',
+            ['repository_connection_id', sa.literal_column('created_at DESC'), sa.literal_column('id DESC')],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('workflow_runs', schema=None) as batch_op:
+        batch_op.drop_index('idx_wfrun_repo_created_id')
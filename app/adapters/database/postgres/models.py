@@ -827,6 +827,15 @@ class RepositoryConnectionTable(SQLModel, table=True):
     __table_args__ = (
         Index('idx_repo_user_full_name', 'user_id', 'repository_full_name', unique=True),
         Index('idx_repo_oauth_enabled', 'oauth_connection_id', 'is_enabled'),
+        # Resolves a user's connection ids for the workflow run join with an index-only scan
+        Index('idx_repo_user_id', 'user_id', 'id'),
+        # Covers the webhook lookup so it can be answered by an index-only scan
+        Index(
+            'idx_repo_provider_full_name_covering',
+            'provider',
+            'repository_full_name',
+            postgresql_include=['id', 'user_id', 'webhook_secret', 'is_enabled', 'auto_pr_enabled'],
+        ),
     )
 
 
@@ -890,6 +899,7 @@ class WorkflowRunTable(SQLModel, table=True):
         Index('idx_wfrun_repo_run_id', 'repository_connection_id', 'run_id', unique=True),
         Index('idx_wfrun_incident', 'incident_id'),
         Index('idx_wfrun_status', 'status', 'conclusion'),
+        Index('idx_wfrun_repo_created_id', 'repository_connection_id', desc('created_at'), desc('id')),
     )
 
 
@@ -34,7 +34,7 @@ class UserRepository:
 
     def get_by_id(self, user_id: str) -> Optional[UserTable]:
         """Get user by ID."""
-        return self.db.query(UserTable).filter(UserTable.user_id == user_id).first()
+        return self.db.get(UserTable, user_id)
 
     def get_by_email(self, email: str) -> Optional[UserTable]:
         """Get user by email."""
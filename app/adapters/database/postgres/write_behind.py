@@ -0,0 +1,137 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+"""
+Write-Behind Timestamp Buffers
+
+Coalesces "last seen" timestamp bumps in memory and writes them to the
+database in one bulk UPDATE per flush interval, instead of one UPDATE per
+event on the request path.
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable
+
+from sqlalchemy import update
+import structlog
+
+from app.dependencies import get_session_local
+
+logger = structlog.get_logger(__name__)
+
+WRITE_BEHIND_FLUSH_INTERVAL_SECONDS = 5.0
+
+
+class TimestampWriteBuffer:
+    """
+    Buffers the latest timestamp per row and flushes them in bulk.
+
+    Rows are updated by primary key, so ``key_column`` must be the table's
+    primary key attribute.
+    """
+
+    def __init__(self, table: Any, key_column: str, timestamp_column: str):
+        """
+        Initialize the buffer.
+
+        Args:
+            table: ORM model to update
+            key_column: Primary key attribute name
+            timestamp_column: Timestamp attribute name to write
+        """
+        self.table = table
+        self.key_column = key_column
+        self.timestamp_column = timestamp_column
+        self._pending: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, timestamp: datetime) -> None:
+        """
+        Buffer a timestamp, keeping the latest one per key.
+
+        Args:
+            key: Primary key of the row
+            timestamp: Time to write
+        """
+        with self._lock:
+            current = self._pending.get(key)
+            if current is None or timestamp > current:
+                self._pending[key] = timestamp
+
+    def _drain(self) -> Dict[str, datetime]:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def _write(self, pending: Dict[str, datetime]) -> None:
+        SessionLocal = get_session_local()
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(self.table),
+                [
+                    {self.key_column: key, self.timestamp_column: timestamp}
+                    for key, timestamp in pending.items()
+                ],
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def flush(self) -> int:
+        """
+        Write all buffered timestamps in a single bulk UPDATE.
+
+        Returns:
+            Number of rows updated
+        """
+        pending = self._drain()
+        if not pending:
+            return 0
+
+        try:
+            await asyncio.to_thread(self._write, pending)
+        except Exception as e:
+            # Put the timestamps back so the next flush retries them.
+            for key, timestamp in pending.items():
+                self.record(key, timestamp)
+            logger.warning(
+                "write_behind_flush_failed",
+                column=self.timestamp_column,
+                count=len(pending),
+                error=str(e),
+            )
+            return 0
+
+        logger.debug("write_behind_flushed", column=self.timestamp_column, count=len(pending))
+        return len(pending)
+
+
+async def run_write_behind_flusher(
+    buffers: Iterable[TimestampWriteBuffer],
+    interval: float = WRITE_BEHIND_FLUSH_INTERVAL_SECONDS,
+) -> None:
+    """
+    Flush the given buffers every ``interval`` seconds until cancelled.
+
+    A final flush runs on cancellation so shutdown does not drop updates.
+
+    Args:
+        buffers: Buffers to flush
+        interval: Seconds between flushes
+    """
+    buffers = tuple(buffers)
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            for buffer in buffers:
+                await buffer.flush()
+    except asyncio.CancelledError:
+        for buffer in buffers:
+            await buffer.flush()
+        raise
@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import base64
-import hashlib
 import hmac
 import secrets
 
@@ -29,19 +28,19 @@ def verify_github_signature(body: bytes, signature_header: str, secret: str) ->
         )
         return False
 
-    expected_signature = hmac.new(
-        secret.encode(),
-        body,
-        hashlib.sha256,
-    ).hexdigest()
-
     received_signature = signature_header[7:] if signature_header.startswith("sha256=") else signature_header
-    is_valid = hmac.compare_digest(expected_signature, received_signature)
+    try:
+        received_digest = bytes.fromhex(received_signature)
+    except ValueError:
+        logger.warning("signature_verification_malformed_header")
+        return False
+
+    expected_digest = hmac.digest(secret.encode(), body, "sha256")
+    is_valid = hmac.compare_digest(expected_digest, received_digest)
 
     logger.debug(
         "signature_verification_result",
         signature_match=is_valid,
-        expected_prefix=expected_signature[:16] + "...",
         received_prefix=received_signature[:16] + "...",
     )
     return is_valid
@@ -2,9 +2,10 @@
 # DevFlowFix - Autonomous AI agent the detects, analyzes, and resolves CI/CD failures in real-time.
 
 from datetime import datetime, timezone
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 import structlog
 import asyncio
@@ -19,6 +20,9 @@ logger = structlog.get_logger()
 
 router = APIRouter(prefix="/logs", tags=["Application Logs"])
 
+# Validates a page of log rows through one core schema
+_LOG_LIST_ADAPTER = TypeAdapter(List[ApplicationLogResponse])
+
 
 def get_app_log_repo(db: Session = Depends(get_db)) -> ApplicationLogRepository:
     """Get application log repository."""
@@ -237,7 +241,7 @@ async def get_application_logs(
         )
 
     return ApplicationLogListResponse(
-        logs=[ApplicationLogResponse.model_validate(log) for log in logs],
+        logs=_LOG_LIST_ADAPTER.validate_python(logs, from_attributes=True),
         total=total,
         skip=skip,
         limit=limit,
@@ -9,10 +9,11 @@ Provides metrics, trends, and dashboard data.
 
 import hashlib
 import json
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.orm import Session
 import structlog
 
@@ -33,6 +34,9 @@ logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 ANALYTICS_CACHE_TTL_SECONDS = 120
 
+# Validates a whole list of repository metrics in one pydantic-core call
+_REPOSITORY_HEALTH_ADAPTER = TypeAdapter(List[RepositoryHealthMetrics])
+
 
 def _build_cache_key(route_name: str, user_id: str, **params: object) -> str:
     normalized = json.dumps(
@@ -52,11 +56,12 @@ async def _get_cached_response(cache_key: str):
         return None
 
 
-async def _set_cached_response(cache_key: str, payload: object) -> None:
+async def _set_cached_response(cache_key: str, payload: BaseModel) -> None:
     try:
         await get_redis_cache().set(
             cache_key,
-            jsonable_encoder(payload),
+            # One pydantic-core dump for the whole response, time series included
+            payload.model_dump(mode="json"),
             ttl=ANALYTICS_CACHE_TTL_SECONDS,
         )
     except Exception as exc:
@@ -187,7 +192,7 @@ async def get_repository_health(
         )
 
         # Convert to Pydantic models
-        repositories = [RepositoryHealthMetrics(**metrics) for metrics in health_metrics]
+        repositories = _REPOSITORY_HEALTH_ADAPTER.validate_python(health_metrics)
 
         # Calculate average health score
         avg_health_score = (
@@ -415,7 +420,7 @@ async def get_dashboard_summary(
                 "merged_prs": 0,
                 "merge_rate": 0.0,
             },
-            top_repositories=[RepositoryHealthMetrics(**r) for r in top_repositories],
+            top_repositories=_REPOSITORY_HEALTH_ADAPTER.validate_python(top_repositories),
             recent_failures=[],
             recent_fixes=[],
             generated_at=datetime.now(timezone.utc),
@@ -7,10 +7,13 @@ OAuth API Router
 Combines all OAuth provider routers (GitHub, GitLab, etc.)
 """
 
+from typing import List
+
 from fastapi import APIRouter, Depends, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.core.schemas.oauth import OAuthConnectionListResponse
+from app.core.schemas.oauth import OAuthConnectionListResponse, OAuthConnectionResponse
 from app.dependencies import get_db
 from app.auth import get_current_active_user
 from app.services.oauth.token_manager import get_token_manager
@@ -28,6 +31,9 @@ router.include_router(gitlab.router)
 
 settings = get_settings()
 
+# Validates all of a user's connection rows through one core schema
+_CONNECTION_LIST_ADAPTER = TypeAdapter(List[OAuthConnectionResponse])
+
 
 @router.get(
     "/connections",
@@ -48,7 +54,6 @@ async def list_oauth_connections(
     - List of all active OAuth connections (GitHub, GitLab, etc.)
     """
     from app.adapters.database.postgres.models import OAuthConnectionTable
-    from app.core.schemas.oauth import OAuthConnectionResponse
 
     user = current_user_data["user"]
 
@@ -61,9 +66,9 @@ async def list_oauth_connections(
         .all()
     )
 
-    connection_responses = [
-        OAuthConnectionResponse.from_orm(conn) for conn in connections
-    ]
+    connection_responses = _CONNECTION_LIST_ADAPTER.validate_python(
+        connections, from_attributes=True
+    )
 
     return OAuthConnectionListResponse(
         connections=connection_responses,
@@ -129,7 +129,7 @@ async def sync_github_connection(
             connection_id=oauth_connection.id,
         )
 
-        return OAuthConnectionResponse.from_orm(oauth_connection)
+        return OAuthConnectionResponse.model_validate(oauth_connection)
 
     except HTTPException:
         raise
@@ -179,7 +179,7 @@ async def get_github_connection(
                    "Use POST /sync to sync your GitHub connection from Zitadel."
         )
 
-    return OAuthConnectionResponse.from_orm(connection)
+    return OAuthConnectionResponse.model_validate(connection)
 
 @router.get(
     "/status",
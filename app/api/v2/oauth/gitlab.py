@@ -130,7 +130,7 @@ async def sync_gitlab_connection(
             connection_id=oauth_connection.id,
         )
 
-        return OAuthConnectionResponse.from_orm(oauth_connection)
+        return OAuthConnectionResponse.model_validate(oauth_connection)
 
     except HTTPException:
         raise
@@ -181,7 +181,7 @@ async def get_gitlab_connection(
                    "Use POST /sync to sync your GitLab connection from Zitadel."
         )
 
-    return OAuthConnectionResponse.from_orm(connection)
+    return OAuthConnectionResponse.model_validate(connection)
 
 
 @router.get(
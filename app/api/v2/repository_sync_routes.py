@@ -107,7 +107,7 @@ async def sync_workflow_runs(
                     commit_sha=run["head_sha"],
                     commit_message=run.get("head_commit", {}).get("message", ""),
                     author=run.get("head_commit", {}).get("author", {}).get("name", ""),
-                    run_started_at=datetime.fromisoformat(run["run_started_at"].replace("Z", "+00:00")) if run.get("run_started_at") else None,
+                    run_started_at=datetime.fromisoformat(run["run_started_at"]) if run.get("run_started_at") else None,
                     run_url=run["html_url"],
                     logs_url=run.get("logs_url"),
                     created_at=datetime.now(timezone.utc),
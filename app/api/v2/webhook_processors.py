@@ -1,9 +1,17 @@
 # Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
 # DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
 
-from typing import Any, Dict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+import asyncio
+import base64
+import re
+import secrets
+import uuid
 
 import structlog
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.adapters.database.postgres.models import (
@@ -13,13 +21,18 @@ from app.adapters.database.postgres.models import (
     LogLevel,
     PRStatus,
     PullRequestTable,
-    RepositoryConnectionTable,
     WorkflowRunTable,
 )
 from app.core.config import get_settings
+from app.core.schemas.webhook import GitHubWorkflowRunEvent
 from app.dependencies import get_service_container
+from app.services.oauth.token_manager import get_token_manager
+from app.services.webhook.repository_lookup import RepositoryConnectionSnapshot
+from app.services.workflow.workflow_tracker import WorkflowTracker
 
 logger = structlog.get_logger(__name__)
+settings = get_settings()
+token_manager = get_token_manager(settings.oauth_token_encryption_key)
 
 
 async def _fetch_error_file_contents(
@@ -30,9 +43,6 @@ async def _fetch_error_file_contents(
     error_summary: str,
 ) -> str:
     """Extract file paths from error logs and fetch their contents from GitHub."""
-    import base64
-    import re
-
     from app.adapters.external.github.client import GitHubClient
 
     file_patterns = [
@@ -81,82 +91,106 @@ async def _fetch_error_file_contents(
     return "\n\n".join(repository_code_parts)
 
 
+def _upsert_workflow_run(db: Session, **values: Any) -> WorkflowRunTable:
+    """Insert a workflow run, or refresh its status if the run is already tracked."""
+    insert_stmt = pg_insert(WorkflowRunTable).values(**values)
+    # Redeliveries and re-runs hit the (repository_connection_id, run_id)
+    # unique index, so only the mutable status fields are refreshed.
+    upsert_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=[WorkflowRunTable.repository_connection_id, WorkflowRunTable.run_id],
+        set_={
+            "status": insert_stmt.excluded.status,
+            "conclusion": insert_stmt.excluded.conclusion,
+            "updated_at": insert_stmt.excluded.updated_at,
+        },
+    ).returning(WorkflowRunTable)
+    return db.scalars(
+        upsert_stmt,
+        execution_options={"populate_existing": True},
+    ).one()
+
+
+def _find_webhook_incident_id(
+    db: Session,
+    user_id: str,
+    source: str,
+    workflow_run_id: str,
+) -> Optional[str]:
+    """Return the id of the incident already opened for a workflow run, if any."""
+    # Filter on the JSON context in SQL and fetch only the key, so a burst of
+    # failures does not reload every webhook incident for the user each time.
+    return db.scalars(
+        select(IncidentTable.incident_id).where(
+            IncidentTable.user_id == user_id,
+            IncidentTable.source == source,
+            IncidentTable.context["workflow_run_id"].as_string() == workflow_run_id,
+        ).limit(1)
+    ).first()
+
+
+def _insert_row(db: Session, row: Any) -> None:
+    """Add a new row and flush it so the INSERT is issued immediately."""
+    db.add(row)
+    db.flush()
+
+
 async def process_workflow_run_event(
     db: Session,
     payload: Dict[str, Any],
-    repo_conn: RepositoryConnectionTable,
+    repo_conn: RepositoryConnectionSnapshot,
 ) -> Dict[str, Any]:
     """Process workflow_run webhook event."""
-    from datetime import datetime, timezone
-    import uuid
-
-    action = payload.get("action")
-    workflow_run_data = payload.get("workflow_run", {})
+    event = GitHubWorkflowRunEvent.model_validate(payload)
+    action = event.action
+    run = event.workflow_run
+    run_id = str(run.id)
+    log = logger.bind(run_id=run_id, repository=repo_conn.repository_full_name)
 
-    logger.info(
+    log.info(
         "processing_workflow_run_event",
-        repository=repo_conn.repository_full_name,
         action=action,
-        run_id=workflow_run_data.get("id"),
-        status=workflow_run_data.get("status"),
-        conclusion=workflow_run_data.get("conclusion"),
+        status=run.status,
+        conclusion=run.conclusion,
     )
 
     if action != "completed":
         return {"status": "ok", "message": f"Workflow action '{action}' not processed"}
 
-    run_id = str(workflow_run_data["id"])
-    existing_run = db.query(WorkflowRunTable).filter(
-        WorkflowRunTable.repository_connection_id == repo_conn.id,
-        WorkflowRunTable.run_id == run_id,
-    ).first()
+    now = datetime.now(timezone.utc)
+    workflow_run = await asyncio.to_thread(
+        _upsert_workflow_run,
+        db,
+        id=WorkflowTracker.generate_workflow_run_id(),
+        repository_connection_id=repo_conn.id,
+        run_id=run_id,
+        run_number=run.run_number,
+        workflow_name=run.name,
+        workflow_id=str(run.workflow_id),
+        status=run.status,
+        conclusion=run.conclusion,
+        branch=run.head_branch,
+        commit_sha=run.head_sha,
+        commit_message=run.head_commit.message,
+        author=run.head_commit.author.name,
+        started_at=run.run_started_at,
+        run_url=run.html_url,
+        run_metadata={
+            "event": run.event,
+            "logs_url": run.logs_url,
+            "workflow_path": run.path,
+        },
+        created_at=now,
+        updated_at=now,
+    )
+    log.info("workflow_run_upserted", workflow_run_id=workflow_run.id)
 
-    if existing_run:
-        existing_run.status = workflow_run_data["status"]
-        existing_run.conclusion = workflow_run_data.get("conclusion")
-        existing_run.updated_at = datetime.now(timezone.utc)
-        workflow_run = existing_run
-        logger.info("workflow_run_updated", run_id=run_id)
-    else:
-        workflow_run = WorkflowRunTable(
-            id=str(uuid.uuid4()),
-            repository_connection_id=repo_conn.id,
-            run_id=run_id,
-            run_number=workflow_run_data["run_number"],
-            workflow_name=workflow_run_data["name"],
-            workflow_id=str(workflow_run_data["workflow_id"]),
-            status=workflow_run_data["status"],
-            conclusion=workflow_run_data.get("conclusion"),
-            branch=workflow_run_data["head_branch"],
-            commit_sha=workflow_run_data["head_sha"],
-            commit_message=workflow_run_data.get("head_commit", {}).get("message", ""),
-            author=workflow_run_data.get("head_commit", {}).get("author", {}).get("name", ""),
-            started_at=datetime.fromisoformat(workflow_run_data["run_started_at"].replace("Z", "+00:00")) if workflow_run_data.get("run_started_at") else None,
-            run_url=workflow_run_data["html_url"],
-            run_metadata={
-                "event": workflow_run_data.get("event"),
-                "logs_url": workflow_run_data.get("logs_url"),
-                "workflow_path": workflow_run_data.get("path"),
-            },
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        db.add(workflow_run)
-        logger.info("workflow_run_created", run_id=run_id)
-
-    if workflow_run_data.get("conclusion") == "failure":
-        existing_incidents = db.query(IncidentTable).filter(
-            IncidentTable.user_id == repo_conn.user_id,
-            IncidentTable.source == "webhook",
-        ).all()
-
-        existing_incident = next(
-            (inc for inc in existing_incidents if inc.context and inc.context.get("workflow_run_id") == workflow_run.id),
-            None,
+    if run.conclusion == "failure":
+        existing_incident_id = await asyncio.to_thread(
+            _find_webhook_incident_id, db, repo_conn.user_id, "webhook", workflow_run.id
         )
 
-        if not existing_incident:
-            incident_id = f"inc_{uuid.uuid4().hex[:8]}"
+        if not existing_incident_id:
+            incident_id = f"inc_{secrets.token_hex(4)}"
             error_log = (
                 f"Workflow run #{workflow_run.run_number} failed.\n\n"
                 f"Commit: {workflow_run.commit_sha[:7]}\n"
@@ -167,7 +201,7 @@ async def process_workflow_run_event(
             incident = IncidentTable(
                 incident_id=incident_id,
                 user_id=repo_conn.user_id,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=now,
                 severity="high",
                 source="webhook",
                 failure_type="workflow_failure",
@@ -187,11 +221,10 @@ async def process_workflow_run_event(
                     "author": workflow_run.author,
                 },
                 raw_payload=payload,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+                created_at=now,
+                updated_at=now,
             )
-            db.add(incident)
-            db.flush()
+            await asyncio.to_thread(_insert_row, db, incident)
 
             pr_created = False
             pr_number = None
@@ -202,11 +235,8 @@ async def process_workflow_run_event(
                     from app.core.enums import IncidentSource
                     from app.core.models.incident import Incident
                     from app.services.github_log_parser import GitHubLogExtractor
-                    from app.services.oauth.token_manager import get_token_manager
                     from app.services.pr_creator import PRCreatorService
 
-                    settings = get_settings()
-                    token_manager = get_token_manager(settings.oauth_token_encryption_key)
                     container = get_service_container()
 
                     oauth_conn = await token_manager.get_oauth_connection(
@@ -279,7 +309,7 @@ async def process_workflow_run_event(
                         pr_number = pr_result.get("number")
                         pr_url = pr_result.get("html_url")
                 except Exception as exc:
-                    logger.error("auto_pr_creation_error", incident_id=incident_id, error=str(exc), exc_info=True)
+                    log.error("auto_pr_creation_error", incident_id=incident_id, error=str(exc), exc_info=True)
 
             return {
                 "status": "ok",
@@ -294,42 +324,45 @@ async def process_workflow_run_event(
     return {"status": "ok", "action": "workflow_run_processed", "workflow_run_id": run_id}
 
 
-async def process_pull_request_event(
-    db: Session,
-    payload: Dict[str, Any],
-    repo_conn: RepositoryConnectionTable,
-) -> Dict[str, Any]:
-    """Process pull_request webhook event."""
-    from datetime import datetime, timezone
+# pull_request payload field -> PullRequestTable column, copied when present.
+_PR_STAT_COLUMNS = (
+    ("additions", "additions"),
+    ("deletions", "deletions"),
+    ("changed_files", "files_changed"),
+    ("commits", "commits_count"),
+    ("review_comments", "review_comments_count"),
+)
 
-    action = payload.get("action")
-    pr_data = payload.get("pull_request", {})
+
+def _apply_pull_request_event(
+    db: Session,
+    repository_full_name: str,
+    action: Optional[str],
+    pr_data: Dict[str, Any],
+) -> Optional[PRStatus]:
+    """Update a tracked PR and its incident, returning the new status or None if untracked."""
+    now = datetime.now(timezone.utc)
     pr_number = pr_data.get("number")
 
     pr_record = db.query(PullRequestTable).filter(
-        PullRequestTable.repository_full == repo_conn.repository_full_name,
+        PullRequestTable.repository_full == repository_full_name,
         PullRequestTable.pr_number == pr_number,
     ).first()
 
     if not pr_record:
-        return {
-            "status": "ok",
-            "action": "pull_request_logged",
-            "pr_number": pr_number,
-            "message": "PR not tracked (not an auto-fix PR)",
-        }
+        return None
 
-    pr_record.updated_at = datetime.now(timezone.utc)
+    pr_record.updated_at = now
     if action == "closed":
         if pr_data.get("merged"):
             pr_record.status = PRStatus.MERGED
-            pr_record.merged_at = datetime.fromisoformat(pr_data["merged_at"].replace("Z", "+00:00")) if pr_data.get("merged_at") else datetime.now(timezone.utc)
+            pr_record.merged_at = datetime.fromisoformat(pr_data["merged_at"]) if pr_data.get("merged_at") else now
             incident = db.query(IncidentTable).filter(IncidentTable.incident_id == pr_record.incident_id).first()
             if incident:
                 incident.outcome = "auto_fixed"
                 incident.outcome_message = f"Fixed by PR #{pr_number}"
                 incident.resolved_at = pr_record.merged_at
-                incident.updated_at = datetime.now(timezone.utc)
+                incident.updated_at = now
                 if incident.created_at:
                     incident.resolution_time_seconds = int((pr_record.merged_at - incident.created_at).total_seconds())
                 if incident.context:
@@ -337,7 +370,7 @@ async def process_pull_request_event(
                     incident.context["merged_at"] = pr_record.merged_at.isoformat()
         else:
             pr_record.status = PRStatus.CLOSED
-            pr_record.closed_at = datetime.now(timezone.utc)
+            pr_record.closed_at = now
     elif action in {"opened", "reopened", "ready_for_review"}:
         pr_record.status = PRStatus.OPEN
     elif action == "converted_to_draft":
@@ -347,36 +380,56 @@ async def process_pull_request_event(
     elif action == "synchronize":
         pr_record.commits_count = pr_data.get("commits", pr_record.commits_count)
 
-    if pr_data.get("additions") is not None:
-        pr_record.additions = pr_data.get("additions")
-    if pr_data.get("deletions") is not None:
-        pr_record.deletions = pr_data.get("deletions")
-    if pr_data.get("changed_files") is not None:
-        pr_record.files_changed = pr_data.get("changed_files")
-    if pr_data.get("commits") is not None:
-        pr_record.commits_count = pr_data.get("commits")
-    if pr_data.get("review_comments") is not None:
-        pr_record.review_comments_count = pr_data.get("review_comments")
-    if pr_data.get("mergeable") is not None:
-        pr_record.has_conflicts = not pr_data.get("mergeable", True)
+    for payload_field, column in _PR_STAT_COLUMNS:
+        value = pr_data.get(payload_field)
+        if value is not None:
+            setattr(pr_record, column, value)
+    mergeable = pr_data.get("mergeable")
+    if mergeable is not None:
+        pr_record.has_conflicts = not mergeable
+
+    return pr_record.status
+
+
+async def process_pull_request_event(
+    db: Session,
+    payload: Dict[str, Any],
+    repo_conn: RepositoryConnectionSnapshot,
+) -> Dict[str, Any]:
+    """Process pull_request webhook event."""
+    pr_data = payload.get("pull_request", {})
+    pr_number = pr_data.get("number")
+
+    new_status = await asyncio.to_thread(
+        _apply_pull_request_event,
+        db,
+        repo_conn.repository_full_name,
+        payload.get("action"),
+        pr_data,
+    )
+    if new_status is None:
+        return {
+            "status": "ok",
+            "action": "pull_request_logged",
+            "pr_number": pr_number,
+            "message": "PR not tracked (not an auto-fix PR)",
+        }
 
     return {
         "status": "ok",
         "action": "pull_request_tracked",
         "pr_number": pr_number,
-        "new_status": pr_record.status.value,
+        "new_status": new_status.value,
     }
 
 
 async def process_push_event(
     db: Session,
     payload: Dict[str, Any],
-    repo_conn: RepositoryConnectionTable,
+    repo_conn: RepositoryConnectionSnapshot,
 ) -> Dict[str, Any]:
     """Process GitHub push event."""
-    from datetime import datetime, timezone
-    import uuid
-
+    now = datetime.now(timezone.utc)
     ref = payload.get("ref", "")
     commits = payload.get("commits", [])
     before = payload.get("before")
@@ -415,9 +468,9 @@ async def process_push_event(
             "modified_files": list(modified_files)[:20],
         },
         source="github_webhook",
-        created_at=datetime.now(timezone.utc),
+        created_at=now,
     )
-    db.add(log_entry)
+    await asyncio.to_thread(_insert_row, db, log_entry)
 
     risky_patterns = [
         ".github/workflows/",
@@ -450,68 +503,57 @@ async def process_push_event(
 async def process_gitlab_pipeline_event(
     db: Session,
     payload: Dict[str, Any],
-    repo_conn: RepositoryConnectionTable,
+    repo_conn: RepositoryConnectionSnapshot,
 ) -> Dict[str, Any]:
     """Process GitLab pipeline event."""
-    from datetime import datetime, timezone
-    import uuid
-
     pipeline = payload.get("object_attributes", {})
     pipeline_id = str(pipeline.get("id"))
     pipeline_status = pipeline.get("status")
     if pipeline_status not in ["success", "failed"]:
         return {"status": "ok", "message": f"Pipeline status '{pipeline_status}' not processed"}
 
-    commit = payload.get("commit", {})
+    now = datetime.now(timezone.utc)
+    commit = payload.get("commit") or {}
+    commit_sha = commit.get("id", "")
+    commit_message = commit.get("message", "")
+    author_name = (commit.get("author") or {}).get("name", "")
+    pipeline_iid = pipeline.get("iid")
+    pipeline_source = pipeline.get("source")
+    created_at_raw = pipeline.get("created_at")
     branch = pipeline.get("ref", "")
-    existing_run = db.query(WorkflowRunTable).filter(
-        WorkflowRunTable.repository_connection_id == repo_conn.id,
-        WorkflowRunTable.run_id == pipeline_id,
-    ).first()
-
-    if existing_run:
-        existing_run.status = "completed"
-        existing_run.conclusion = pipeline_status
-        existing_run.updated_at = datetime.now(timezone.utc)
-        workflow_run = existing_run
-    else:
-        workflow_run = WorkflowRunTable(
-            id=str(uuid.uuid4()),
-            repository_connection_id=repo_conn.id,
-            run_id=pipeline_id,
-            run_number=pipeline.get("iid", 0),
-            workflow_name=pipeline.get("source", "pipeline"),
-            workflow_id=str(pipeline.get("id")),
-            status="completed",
-            conclusion=pipeline_status,
-            branch=branch,
-            commit_sha=commit.get("id", ""),
-            commit_message=commit.get("message", ""),
-            author=commit.get("author", {}).get("name", ""),
-            started_at=datetime.fromisoformat(pipeline["created_at"].replace("Z", "+00:00")) if pipeline.get("created_at") else None,
-            run_url=payload.get("project", {}).get("web_url", "") + f"/-/pipelines/{pipeline_id}",
-            run_metadata={
-                "source": pipeline.get("source"),
-                "stages": pipeline.get("stages", []),
-                "duration": pipeline.get("duration"),
-                "queued_duration": pipeline.get("queued_duration"),
-            },
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        db.add(workflow_run)
+    workflow_run = await asyncio.to_thread(
+        _upsert_workflow_run,
+        db,
+        id=WorkflowTracker.generate_workflow_run_id(),
+        repository_connection_id=repo_conn.id,
+        run_id=pipeline_id,
+        run_number=pipeline_iid or 0,
+        workflow_name=pipeline_source or "pipeline",
+        workflow_id=str(pipeline.get("id")),
+        status="completed",
+        conclusion=pipeline_status,
+        branch=branch,
+        commit_sha=commit_sha,
+        commit_message=commit_message,
+        author=author_name,
+        started_at=datetime.fromisoformat(created_at_raw) if created_at_raw else None,
+        run_url=payload.get("project", {}).get("web_url", "") + f"/-/pipelines/{pipeline_id}",
+        run_metadata={
+            "source": pipeline_source,
+            "stages": pipeline.get("stages", []),
+            "duration": pipeline.get("duration"),
+            "queued_duration": pipeline.get("queued_duration"),
+        },
+        created_at=now,
+        updated_at=now,
+    )
 
     if pipeline_status == "failed":
-        existing_incidents = db.query(IncidentTable).filter(
-            IncidentTable.user_id == repo_conn.user_id,
-            IncidentTable.source == "gitlab_webhook",
-        ).all()
-        existing_incident = next(
-            (inc for inc in existing_incidents if inc.context and inc.context.get("workflow_run_id") == workflow_run.id),
-            None,
+        existing_incident_id = await asyncio.to_thread(
+            _find_webhook_incident_id, db, repo_conn.user_id, "gitlab_webhook", workflow_run.id
         )
-        if not existing_incident:
-            incident_id = f"inc_{uuid.uuid4().hex[:8]}"
+        if not existing_incident_id:
+            incident_id = f"inc_{secrets.token_hex(4)}"
             failed_jobs = [
                 {
                     "name": build.get("name"),
@@ -522,10 +564,10 @@ async def process_gitlab_pipeline_event(
                 if build.get("status") == "failed"
             ]
             error_log = (
-                f"Pipeline #{pipeline.get('iid', pipeline_id)} failed.\n\n"
-                f"Commit: {commit.get('id', '')[:7]}\n"
+                f"Pipeline #{pipeline_iid or pipeline_id} failed.\n\n"
+                f"Commit: {commit_sha[:7]}\n"
                 f"Branch: {branch}\n"
-                f"Message: {commit.get('message', '')}\n\n"
+                f"Message: {commit_message}\n\n"
             )
             if failed_jobs:
                 error_log += "Failed Jobs:\n"
@@ -535,7 +577,7 @@ async def process_gitlab_pipeline_event(
             incident = IncidentTable(
                 incident_id=incident_id,
                 user_id=repo_conn.user_id,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=now,
                 severity="high",
                 source="gitlab_webhook",
                 failure_type="pipeline_failure",
@@ -545,18 +587,18 @@ async def process_gitlab_pipeline_event(
                     "workflow_run_id": workflow_run.id,
                     "repository": repo_conn.repository_full_name,
                     "branch": branch,
-                    "commit_sha": commit.get("id", ""),
+                    "commit_sha": commit_sha,
                     "pipeline_id": pipeline_id,
-                    "pipeline_iid": pipeline.get("iid"),
+                    "pipeline_iid": pipeline_iid,
                     "run_url": workflow_run.run_url,
                     "failed_jobs": failed_jobs,
-                    "author": commit.get("author", {}).get("name", ""),
+                    "author": author_name,
                 },
                 raw_payload=payload,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+                created_at=now,
+                updated_at=now,
             )
-            db.add(incident)
+            await asyncio.to_thread(_insert_row, db, incident)
             return {
                 "status": "ok",
                 "action": "incident_created",
@@ -567,65 +609,81 @@ async def process_gitlab_pipeline_event(
     return {"status": "ok", "action": "pipeline_processed", "pipeline_id": pipeline_id}
 
 
-async def process_gitlab_merge_request_event(
+def _apply_merge_request_event(
     db: Session,
+    repository_full_name: str,
     payload: Dict[str, Any],
-    repo_conn: RepositoryConnectionTable,
-) -> Dict[str, Any]:
-    """Process GitLab merge request event."""
-    from datetime import datetime, timezone
-
+) -> Optional[PRStatus]:
+    """Update a tracked MR and its incident, returning the new status or None if untracked."""
+    now = datetime.now(timezone.utc)
     mr = payload.get("object_attributes", {})
     mr_iid = mr.get("iid")
     action = mr.get("action")
     state = mr.get("state")
 
     pr_record = db.query(PullRequestTable).filter(
-        PullRequestTable.repository_full == repo_conn.repository_full_name,
+        PullRequestTable.repository_full == repository_full_name,
         PullRequestTable.pr_number == mr_iid,
     ).first()
     if not pr_record:
-        return {
-            "status": "ok",
-            "action": "merge_request_logged",
-            "mr_iid": mr_iid,
-            "message": "MR not tracked (not an auto-fix MR)",
-        }
+        return None
 
-    pr_record.updated_at = datetime.now(timezone.utc)
+    pr_record.updated_at = now
     if action == "merge" or state == "merged":
         pr_record.status = PRStatus.MERGED
-        pr_record.merged_at = datetime.now(timezone.utc)
+        pr_record.merged_at = now
         incident = db.query(IncidentTable).filter(IncidentTable.incident_id == pr_record.incident_id).first()
         if incident:
             incident.outcome = "auto_fixed"
             incident.outcome_message = f"Fixed by MR !{mr_iid}"
-            incident.resolved_at = datetime.now(timezone.utc)
-            incident.updated_at = datetime.now(timezone.utc)
+            incident.resolved_at = now
+            incident.updated_at = now
             if incident.context:
                 incident.context["merged_mr_iid"] = mr_iid
-                incident.context["merged_at"] = datetime.now(timezone.utc).isoformat()
+                incident.context["merged_at"] = now.isoformat()
     elif action == "close" or state == "closed":
         pr_record.status = PRStatus.CLOSED
-        pr_record.closed_at = datetime.now(timezone.utc)
+        pr_record.closed_at = now
     elif action == "approved":
         pr_record.status = PRStatus.APPROVED
         pr_record.approved_by = payload.get("user", {}).get("username")
     elif action in {"open", "reopen"}:
         pr_record.status = PRStatus.OPEN
 
+    return pr_record.status
+
+
+async def process_gitlab_merge_request_event(
+    db: Session,
+    payload: Dict[str, Any],
+    repo_conn: RepositoryConnectionSnapshot,
+) -> Dict[str, Any]:
+    """Process GitLab merge request event."""
+    mr_iid = payload.get("object_attributes", {}).get("iid")
+
+    new_status = await asyncio.to_thread(
+        _apply_merge_request_event, db, repo_conn.repository_full_name, payload
+    )
+    if new_status is None:
+        return {
+            "status": "ok",
+            "action": "merge_request_logged",
+            "mr_iid": mr_iid,
+            "message": "MR not tracked (not an auto-fix MR)",
+        }
+
     return {
         "status": "ok",
         "action": "merge_request_tracked",
         "mr_iid": mr_iid,
-        "new_status": pr_record.status.value,
+        "new_status": new_status.value,
     }
 
 
 async def process_gitlab_push_event(
     db: Session,
     payload: Dict[str, Any],
-    repo_conn: RepositoryConnectionTable,
+    repo_conn: RepositoryConnectionSnapshot,
 ) -> Dict[str, Any]:
     """Process GitLab push event."""
     ref = payload.get("ref", "")
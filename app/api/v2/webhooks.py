@@ -8,13 +8,21 @@ Universal endpoint layer for receiving events from GitHub and GitLab.
 Event-specific processing lives in ``webhook_processors.py``.
 """
 
-from typing import Any, Dict
-import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+import asyncio
+import hashlib
+import itertools
+import threading
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, status
+import orjson
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 import structlog
 
+from app.adapters.cache.redis import get_redis_cache
 from app.api.shared.webhooks import verify_github_signature, verify_gitlab_token
 from app.api.v2.webhook_processors import (
     process_gitlab_merge_request_event,
@@ -25,101 +33,261 @@ from app.api.v2.webhook_processors import (
     process_workflow_run_event,
 )
 from app.core.config import get_settings
-from app.dependencies import get_db
+from app.core.schemas.webhook import GitHubWebhookEnvelope, GitLabWebhookEnvelope
+from app.dependencies import get_session_local
 from app.services.oauth.token_manager import get_token_manager
-from app.adapters.database.postgres.models import RepositoryConnectionTable
+from app.services.webhook.delivery_tracker import record_webhook_delivery
+from app.services.webhook.repository_lookup import (
+    RepositoryConnectionSnapshot,
+    get_cached_repository_connection,
+    get_repository_connection_snapshot,
+)
 
 logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/webhooks", tags=["Webhooks"])
 settings = get_settings()
+token_manager = get_token_manager(settings.oauth_token_encryption_key)
+
+# Fixed error details. Exceptions are still built per raise: a shared instance
+# would carry one request's traceback and context into the next.
+_MISSING_SIGNATURE_DETAIL = "Missing X-Hub-Signature-256 header. Webhook secret not configured in GitHub."
+_INVALID_JSON_DETAIL = "Invalid JSON payload"
+_MISSING_REPOSITORY_DETAIL = "Missing repository information in payload"
+_MISSING_SECRET_DETAIL = "Webhook secret not found. Please reconnect the repository."
+_DECRYPT_FAILED_DETAIL = "Failed to decrypt webhook secret. Please reconnect the repository."
+_INVALID_SIGNATURE_DETAIL = "Invalid webhook signature"
+_MISSING_PROJECT_DETAIL = "Missing project information in payload"
+_INVALID_TOKEN_DETAIL = "Invalid webhook token"
+_PROCESSING_ERROR_DETAIL = "Internal webhook processing error"
+_DATABASE_UNAVAILABLE_DETAIL = (
+    "Database-backed functionality is unavailable because DATABASE_URL is not configured"
+)
+
+# Keyed by ciphertext, so a rotated secret never hits a stale plaintext entry.
+_webhook_secret_cache: TTLCache = TTLCache(maxsize=5000, ttl=300)
+_webhook_secret_cache_lock = threading.Lock()
+
+_GITHUB_EVENT_PROCESSORS = {
+    "workflow_run": process_workflow_run_event,
+    "pull_request": process_pull_request_event,
+    "push": process_push_event,
+}
+
+_GITLAB_EVENT_PROCESSORS = {
+    "Pipeline Hook": process_gitlab_pipeline_event,
+    "Merge Request Hook": process_gitlab_merge_request_event,
+    "Push Hook": process_gitlab_push_event,
+}
+
+# Receipt logs are most of the webhook log volume during bursts, so only one in
+# N is emitted. Warnings and errors are never sampled.
+RECEIPT_LOG_SAMPLE_RATE = 10
+_receipt_log_counter = itertools.count()
+
+DELIVERY_DEDUP_TTL_SECONDS = 600
+# Process-local first line of defence; Redis catches redeliveries that land on other workers.
+_recent_deliveries: TTLCache = TTLCache(maxsize=50_000, ttl=DELIVERY_DEDUP_TTL_SECONDS)
+
+
+def _get_plaintext_secret(ciphertext: str) -> str:
+    """Decrypt a stored webhook secret, reusing recent decryptions."""
+    with _webhook_secret_cache_lock:
+        plaintext = _webhook_secret_cache.get(ciphertext)
+    if plaintext is None:
+        plaintext = token_manager.decrypt_token(ciphertext)
+        with _webhook_secret_cache_lock:
+            _webhook_secret_cache[ciphertext] = plaintext
+    return plaintext
+
+
+def _sample_receipt_log() -> bool:
+    """Return True for one in every RECEIPT_LOG_SAMPLE_RATE webhook receipts."""
+    return next(_receipt_log_counter) % RECEIPT_LOG_SAMPLE_RATE == 0
+
+
+def _open_session() -> Session:
+    """Open a session for one database phase of a webhook, not the whole request."""
+    if not settings.database_configured:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=_DATABASE_UNAVAILABLE_DETAIL,
+        )
+    return get_session_local()()
+
+
+def _load_repository_connection(
+    provider: str,
+    repository_full_name: str,
+) -> Optional[RepositoryConnectionSnapshot]:
+    db = _open_session()
+    try:
+        return get_repository_connection_snapshot(db, provider, repository_full_name)
+    finally:
+        db.close()
+
+
+async def _lookup_repository_connection(
+    provider: str,
+    repository_full_name: str,
+) -> Optional[RepositoryConnectionSnapshot]:
+    """Resolve a repository connection, querying off the event loop on a cache miss."""
+    repo_conn = get_cached_repository_connection(provider, repository_full_name)
+    if repo_conn is None:
+        repo_conn = await asyncio.to_thread(
+            _load_repository_connection, provider, repository_full_name
+        )
+    return repo_conn
+
+
+async def _claim_delivery(delivery_key: str) -> bool:
+    """Record a verified delivery, returning False if it was already claimed."""
+    if delivery_key in _recent_deliveries:
+        return False
+    _recent_deliveries[delivery_key] = True
+
+    try:
+        claimed = await get_redis_cache().set_if_absent(
+            delivery_key, "1", ttl=DELIVERY_DEDUP_TTL_SECONDS
+        )
+    except Exception as exc:
+        logger.warning("webhook_delivery_claim_failed", delivery_key=delivery_key, error=str(exc))
+        return True
+
+    # None means Redis errored; fail open rather than drop the event.
+    return claimed is not False
+
+
+async def _release_delivery(delivery_key: Optional[str]) -> None:
+    """Forget a claimed delivery so the provider's retry is processed."""
+    if not delivery_key:
+        return
+    _recent_deliveries.pop(delivery_key, None)
+    try:
+        await get_redis_cache().delete(delivery_key)
+    except Exception as exc:
+        logger.warning("webhook_delivery_release_failed", delivery_key=delivery_key, error=str(exc))
+
+
+async def _process_github_event(
+    event_type: str,
+    payload: Dict[str, Any],
+    repo_conn: RepositoryConnectionSnapshot,
+    delivery_key: Optional[str],
+) -> None:
+    """Run a verified GitHub event after the webhook has been acknowledged."""
+    log = logger.bind(event_type=event_type, repository=repo_conn.repository_full_name)
+    db = _open_session()
+    try:
+        result = await _GITHUB_EVENT_PROCESSORS[event_type](db, payload, repo_conn)
+        await asyncio.to_thread(db.commit)
+        log.info("github_webhook_processed", message=result.get("message"))
+    except ValidationError as exc:
+        await asyncio.to_thread(db.rollback)
+        log.warning("webhook_payload_invalid", error=str(exc))
+    except Exception as exc:
+        await asyncio.to_thread(db.rollback)
+        # Let a manual redelivery from GitHub try again.
+        await _release_delivery(delivery_key)
+        log.error("webhook_processing_error", error=str(exc), exc_info=True)
+    finally:
+        await asyncio.to_thread(db.close)
 
 
 @router.post(
     "/github",
     status_code=status.HTTP_200_OK,
     summary="GitHub Webhook Endpoint",
-    description="Universal endpoint for receiving GitHub webhook events.",
+    description=(
+        "Universal endpoint for receiving GitHub webhook events. Event types "
+        "the server does not act on are acknowledged without signature "
+        "verification since they cause no state changes."
+    ),
 )
 async def github_webhook(
     request: Request,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
 ) -> Dict[str, Any]:
+    event_type = request.headers.get("X-GitHub-Event")
+    signature = request.headers.get("X-Hub-Signature-256")
+    delivery_id = request.headers.get("X-GitHub-Delivery")
+    now = datetime.now(timezone.utc)
+    log = logger.bind(event_type=event_type, delivery_id=delivery_id)
+    delivery_key = None
     try:
-        event_type = request.headers.get("X-GitHub-Event")
-        signature = request.headers.get("X-Hub-Signature-256")
-        delivery_id = request.headers.get("X-GitHub-Delivery")
-
-        logger.info("github_webhook_received", event_type=event_type, delivery_id=delivery_id)
+        if _sample_receipt_log():
+            log.info("github_webhook_received")
 
         if not signature:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Missing X-Hub-Signature-256 header. Webhook secret not configured in GitHub.",
+                detail=_MISSING_SIGNATURE_DETAIL,
             )
 
+        if event_type not in _GITHUB_EVENT_PROCESSORS:
+            return {"status": "ok", "message": f"Event type {event_type} not processed"}
+
+        github_delivery_key = f"webhook:delivery:github:{delivery_id}" if delivery_id else None
+        # A redelivery this worker already accepted is answered before any parsing or crypto.
+        if github_delivery_key in _recent_deliveries:
+            log.info("github_webhook_duplicate_delivery")
+            return {"status": "ok", "message": "Duplicate delivery ignored"}
+
         body = await request.body()
         try:
-            payload = json.loads(body.decode("utf-8"))
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON payload")
+            payload = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=_INVALID_JSON_DETAIL)
 
-        repository = payload.get("repository", {})
-        repository_full_name = repository.get("full_name")
-        if not repository_full_name:
+        try:
+            envelope = GitHubWebhookEnvelope.model_validate(payload)
+        except ValidationError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Missing repository information in payload",
+                detail=_MISSING_REPOSITORY_DETAIL,
             )
+        repository_full_name = envelope.repository.full_name
 
-        repo_conn = db.query(RepositoryConnectionTable).filter(
-            RepositoryConnectionTable.repository_full_name == repository_full_name,
-            RepositoryConnectionTable.provider == "github",
-        ).first()
+        repo_conn = await _lookup_repository_connection("github", repository_full_name)
         if not repo_conn:
-            logger.warning("webhook_for_unknown_repository", repository=repository_full_name)
+            log.warning("webhook_for_unknown_repository", repository=repository_full_name)
             return {"status": "ok", "message": "Repository not connected"}
 
         if not repo_conn.webhook_secret:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Webhook secret not found. Please reconnect the repository.",
+                detail=_MISSING_SECRET_DETAIL,
             )
 
-        token_manager = get_token_manager(settings.oauth_token_encryption_key)
         try:
-            webhook_secret = token_manager.decrypt_token(repo_conn.webhook_secret)
+            webhook_secret = _get_plaintext_secret(repo_conn.webhook_secret)
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to decrypt webhook secret. Please reconnect the repository.",
+                detail=_DECRYPT_FAILED_DETAIL,
             )
 
         if not verify_github_signature(body, signature, webhook_secret):
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook signature")
-
-        from datetime import datetime, timezone
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=_INVALID_SIGNATURE_DETAIL)
 
-        repo_conn.webhook_last_delivery_at = datetime.now(timezone.utc)
+        if github_delivery_key:
+            if not await _claim_delivery(github_delivery_key):
+                log.info("github_webhook_duplicate_delivery")
+                return {"status": "ok", "message": "Duplicate delivery ignored"}
+            delivery_key = github_delivery_key
 
-        if event_type == "workflow_run":
-            result = await process_workflow_run_event(db, payload, repo_conn)
-        elif event_type == "pull_request":
-            result = await process_pull_request_event(db, payload, repo_conn)
-        elif event_type == "push":
-            result = await process_push_event(db, payload, repo_conn)
-        else:
-            result = {"status": "ok", "message": f"Event type {event_type} not processed"}
+        record_webhook_delivery(repo_conn.id, now)
 
-        db.commit()
-        return result
+        background_tasks.add_task(_process_github_event, event_type, payload, repo_conn, delivery_key)
+        return {"status": "ok", "message": f"Event type {event_type} queued for processing"}
     except HTTPException:
+        await _release_delivery(delivery_key)
         raise
     except Exception as exc:
-        db.rollback()
-        logger.error("webhook_processing_error", error=str(exc), exc_info=True)
+        await _release_delivery(delivery_key)
+        log.error("webhook_processing_error", error=str(exc), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal webhook processing error",
+            detail=_PROCESSING_ERROR_DETAIL,
         ) from exc
 
 
@@ -127,62 +295,76 @@ async def github_webhook(
     "/gitlab",
     status_code=status.HTTP_200_OK,
     summary="GitLab Webhook Endpoint",
-    description="Universal endpoint for receiving GitLab webhook events.",
+    description=(
+        "Universal endpoint for receiving GitLab webhook events. Event types "
+        "the server does not act on are acknowledged without token "
+        "verification since they cause no state changes."
+    ),
 )
-async def gitlab_webhook(
-    request: Request,
-    db: Session = Depends(get_db),
-) -> Dict[str, Any]:
+async def gitlab_webhook(request: Request) -> Dict[str, Any]:
+    event_type = request.headers.get("X-Gitlab-Event")
+    token = request.headers.get("X-Gitlab-Token")
+    now = datetime.now(timezone.utc)
+    log = logger.bind(event_type=event_type)
+    delivery_key = None
     try:
-        event_type = request.headers.get("X-Gitlab-Event")
-        token = request.headers.get("X-Gitlab-Token")
+        if _sample_receipt_log():
+            log.info("gitlab_webhook_received")
 
-        logger.info("gitlab_webhook_received", event_type=event_type)
+        if event_type not in _GITLAB_EVENT_PROCESSORS:
+            return {"status": "ok", "message": f"Event type {event_type} not processed"}
 
         body = await request.body()
         try:
-            payload = json.loads(body.decode("utf-8"))
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON payload")
+            payload = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=_INVALID_JSON_DETAIL)
 
-        project_path = payload.get("project", {}).get("path_with_namespace")
-        if not project_path:
+        try:
+            envelope = GitLabWebhookEnvelope.model_validate(payload)
+        except ValidationError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Missing project information in payload",
+                detail=_MISSING_PROJECT_DETAIL,
             )
+        project_path = envelope.project.path_with_namespace
 
-        repo_conn = db.query(RepositoryConnectionTable).filter(
-            RepositoryConnectionTable.repository_full_name == project_path,
-            RepositoryConnectionTable.provider == "gitlab",
-        ).first()
+        repo_conn = await _lookup_repository_connection("gitlab", project_path)
         if not repo_conn:
-            logger.warning("webhook_for_unknown_project", project=project_path)
+            log.warning("webhook_for_unknown_project", project=project_path)
             return {"status": "ok", "message": "Project not connected"}
 
-        token_manager = get_token_manager(settings.oauth_token_encryption_key)
-        webhook_secret = token_manager.decrypt_token(repo_conn.webhook_secret)
+        webhook_secret = _get_plaintext_secret(repo_conn.webhook_secret)
         if not verify_gitlab_token(token, webhook_secret):
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook token")
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=_INVALID_TOKEN_DETAIL)
 
-        from datetime import datetime, timezone
+        # GitLab has no delivery id header on every version, so the body digest is the key.
+        delivery_key = f"webhook:delivery:gitlab:{hashlib.sha256(body).hexdigest()}"
+        if not await _claim_delivery(delivery_key):
+            log.info("gitlab_webhook_duplicate_delivery", project=project_path)
+            return {"status": "ok", "message": "Duplicate delivery ignored"}
 
-        repo_conn.webhook_last_delivery_at = datetime.now(timezone.utc)
-        db.commit()
+        record_webhook_delivery(repo_conn.id, now)
 
-        if event_type == "Pipeline Hook":
-            return await process_gitlab_pipeline_event(db, payload, repo_conn)
-        if event_type == "Merge Request Hook":
-            return await process_gitlab_merge_request_event(db, payload, repo_conn)
-        if event_type == "Push Hook":
-            return await process_gitlab_push_event(db, payload, repo_conn)
-        return {"status": "ok", "message": f"Event type {event_type} not processed"}
+        # The session is opened only for the processing phase, after the body
+        # read and token check, so no pooled connection waits on the client.
+        db = _open_session()
+        try:
+            result = await _GITLAB_EVENT_PROCESSORS[event_type](db, payload, repo_conn)
+            await asyncio.to_thread(db.commit)
+            return result
+        except Exception:
+            await asyncio.to_thread(db.rollback)
+            raise
+        finally:
+            await asyncio.to_thread(db.close)
     except HTTPException:
+        await _release_delivery(delivery_key)
         raise
     except Exception as exc:
-        db.rollback()
-        logger.error("gitlab_webhook_processing_error", error=str(exc), exc_info=True)
+        await _release_delivery(delivery_key)
+        log.error("gitlab_webhook_processing_error", error=str(exc), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal webhook processing error",
+            detail=_PROCESSING_ERROR_DETAIL,
         ) from exc
@@ -7,32 +7,156 @@ Workflow Run API Endpoints
 Handles workflow run tracking, statistics, and management.
 """
 
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import asyncio
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import base64
+import binascii
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response, status, Query
+from pydantic import TypeAdapter
+from sqlalchemy import Row, and_, desc, func, lambda_stmt, select, tuple_
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 import structlog
 
 from app.core.config import get_settings
 from app.core.schemas.workflow import (
     WorkflowRunResponse,
+    WorkflowRunSummaryResponse,
     WorkflowRunListResponse,
     WorkflowRunStatsResponse,
     WorkflowRetryRequest,
+    WorkflowBulkRetryRequest,
+    WorkflowBulkRetryResponse,
+    WorkflowRetryResult,
 )
 from app.dependencies import get_db
 from app.auth import get_current_active_user
 from app.services.oauth.token_manager import get_token_manager
 from app.services.workflow.workflow_tracker import WorkflowTracker
-from app.adapters.database.postgres.models import RepositoryConnectionTable
+from app.adapters.database.postgres.models import (
+    OAuthConnectionTable,
+    RepositoryConnectionTable,
+    WorkflowRunTable,
+)
 
 logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/workflows", tags=["Workflows"])
 settings = get_settings()
 
+RUN_LIST_BATCH_SIZE = 50
+
+# Tracking IDs are wfr_<32 hex> for runs created by webhooks and WorkflowTracker
+# (GitHub and GitLab alike), or a UUID string for runs created by repository sync
+# and the GitLab pipeline tracker; anything else is rejected with 422 before a
+# query is issued.
+_RUN_ID_PATTERN = (
+    r"^(wfr_[0-9a-f]{32}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$"
+)
+
+# The columns WorkflowRunResponse serializes, in field order.
+_RUN_RESPONSE_FIELDS = tuple(
+    getattr(WorkflowRunTable, name) for name in WorkflowRunResponse.model_fields
+)
+
+
+# The narrower column set list pages return; details come from GET /runs/{id}.
+_RUN_SUMMARY_FIELDS = tuple(
+    getattr(WorkflowRunTable, name) for name in WorkflowRunSummaryResponse.model_fields
+)
+
+# Validates a whole batch of run rows through one core schema
+_RUN_LIST_ADAPTER = TypeAdapter(List[WorkflowRunSummaryResponse])
+
+# Keyset order for run pages, matching idx_wfrun_repo_created_id
+_NEWEST_FIRST = (desc(WorkflowRunTable.created_at), desc(WorkflowRunTable.id))
+
+
+def _runs_etag(user_id: str, *parts: object) -> str:
+    """Build a strong ETag from the user and the values a response depends on."""
+    digest = hashlib.sha1(":".join(map(str, (user_id, *parts))).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already names this ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+    )
+
+
+def _scoped_to_user(stmt: StatementLambdaElement, user_id: str) -> StatementLambdaElement:
+    """
+    Restrict a workflow run lambda statement to the user's repositories.
+
+    Built from lambdas so SQLAlchemy caches the construct and its compiled
+    SQL; only ``user_id`` is re-bound per call.
+    """
+    return stmt + (
+        lambda s: s.join(
+            RepositoryConnectionTable,
+            WorkflowRunTable.repository_connection_id == RepositoryConnectionTable.id,
+        ).where(RepositoryConnectionTable.user_id == user_id)
+    )
+
+
+def _in_user_repositories(stmt: StatementLambdaElement, user_id: str) -> StatementLambdaElement:
+    """
+    Restrict a workflow run lambda statement to the user's repositories
+    without joining.
+
+    The user's connection ids are resolved in a subquery first, so the
+    planner drives from that small set into the workflow_runs index rather
+    than joining the whole table before filtering.
+    """
+    return stmt + (
+        lambda s: s.where(
+            WorkflowRunTable.repository_connection_id.in_(
+                select(RepositoryConnectionTable.id).where(
+                    RepositoryConnectionTable.user_id == user_id
+                )
+            )
+        )
+    )
+
+
+def _encode_run_cursor(run: Row) -> str:
+    """Encode a run's (created_at, id) sort key as an opaque page cursor."""
+    raw = f"{run.created_at.isoformat()}|{run.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
 
+
+def _decode_run_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a page cursor back into its (created_at, id) sort key."""
+    try:
+        created_at, run_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), run_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+@lru_cache()
 def get_workflow_tracker() -> WorkflowTracker:
     """
-    Get workflow tracker instance.
+    Get the process-wide workflow tracker instance.
+
+    Used as a FastAPI dependency; the tracker is stateless apart from the
+    global token manager, so one instance is shared by every request.
 
     Returns:
         WorkflowTracker instance
@@ -49,10 +173,13 @@ def get_workflow_tracker() -> WorkflowTracker:
     description="List workflow runs for user's repositories.",
 )
 async def list_workflow_runs(
+    request: Request,
+    response: Response,
     repository_connection_id: Optional[str] = Query(None, description="Filter by repository connection"),
     status_filter: Optional[str] = Query(None, description="Filter by status"),
     conclusion_filter: Optional[str] = Query(None, description="Filter by conclusion"),
     limit: int = Query(50, ge=1, le=200, description="Maximum number of runs"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db),
     current_user_data: dict = Depends(get_current_active_user),
 ) -> WorkflowRunListResponse:
@@ -64,14 +191,25 @@ async def list_workflow_runs(
     - status_filter: Filter by status (queued, in_progress, completed)
     - conclusion_filter: Filter by conclusion (success, failure, cancelled, etc.)
     - limit: Maximum number of runs to return (default: 50, max: 200)
+    - cursor: Resume after the last run of a previous page
 
     **Returns:**
-    - List of workflow runs
-    - Statistics (total, failed, successful)
+    - Workflow run summaries, newest first (GET /runs/{run_id} for full details)
+    - next_cursor for the following page, if there may be more runs
+    - Statistics (total, failed, successful) across all matching runs, not only the returned page
+    - ETag; repeat polls sending it in If-None-Match get 304 while no matching run changed
     """
     try:
         user = current_user_data["user"]
-        tracker = get_workflow_tracker()
+        page_stmt = lambda_stmt(lambda: select(*_RUN_SUMMARY_FIELDS))
+        totals_stmt = lambda_stmt(
+            lambda: select(
+                func.count(WorkflowRunTable.id),
+                func.count(WorkflowRunTable.id).filter(WorkflowRunTable.conclusion == "failure"),
+                func.count(WorkflowRunTable.id).filter(WorkflowRunTable.conclusion == "success"),
+                func.max(WorkflowRunTable.updated_at),
+            )
+        )
 
         # If specific repository requested, verify user owns it
         if repository_connection_id:
@@ -90,46 +228,70 @@ async def list_workflow_runs(
                     detail="Repository connection not found"
                 )
 
-            runs = await tracker.get_workflow_runs_for_repository(
-                db=db,
-                repository_connection_id=repository_connection_id,
-                status_filter=status_filter,
-                conclusion_filter=conclusion_filter,
-                limit=limit,
-            )
+            criteria = [
+                lambda s: s.where(WorkflowRunTable.repository_connection_id == repository_connection_id)
+            ]
         else:
             # Get all runs for user's repositories
-            from app.adapters.database.postgres.models import WorkflowRunTable
-            from sqlalchemy import and_
-
-            query = (
-                db.query(WorkflowRunTable)
-                .join(
-                    RepositoryConnectionTable,
-                    WorkflowRunTable.repository_connection_id == RepositoryConnectionTable.id,
-                )
-                .filter(RepositoryConnectionTable.user_id == user.user_id)
+            page_stmt = _in_user_repositories(page_stmt, user.user_id)
+            totals_stmt = _in_user_repositories(totals_stmt, user.user_id)
+            criteria = []
+
+        if status_filter:
+            criteria.append(lambda s: s.where(WorkflowRunTable.status == status_filter))
+
+        if conclusion_filter:
+            criteria.append(lambda s: s.where(WorkflowRunTable.conclusion == conclusion_filter))
+
+        for criterion in criteria:
+            page_stmt += criterion
+            totals_stmt += criterion
+
+        if cursor:
+            # Keyset seek: each page costs O(limit) however deep the caller walks
+            cursor_created_at, cursor_id = _decode_run_cursor(cursor)
+            page_stmt += lambda s: s.where(
+                tuple_(WorkflowRunTable.created_at, WorkflowRunTable.id)
+                < tuple_(cursor_created_at, cursor_id)
             )
 
-            if status_filter:
-                query = query.filter(WorkflowRunTable.status == status_filter)
-
-            if conclusion_filter:
-                query = query.filter(WorkflowRunTable.conclusion == conclusion_filter)
-
-            from sqlalchemy import desc
-            runs = query.order_by(desc(WorkflowRunTable.created_at)).limit(limit).all()
-
-        run_responses = [WorkflowRunResponse.from_orm(run) for run in runs]
-
-        failed_runs = len([r for r in runs if r.conclusion == "failure"])
-        successful_runs = len([r for r in runs if r.conclusion == "success"])
-
+        page_stmt += lambda s: s.order_by(*_NEWEST_FIRST).limit(limit)
+
+        # Totals over every matching run in one aggregate pass, not just this page.
+        # The same row fingerprints the result, so unchanged polls skip the page query.
+        total, failed_runs, successful_runs, last_updated_at = db.execute(totals_stmt).one()
+
+        etag = _runs_etag(
+            user.user_id,
+            repository_connection_id,
+            status_filter,
+            conclusion_filter,
+            cursor,
+            limit,
+            total,
+            last_updated_at,
+        )
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+
+        # Stream the page in batches and serialize plain column rows as they
+        # arrive; a read-only list needs no identity map or change tracking
+        run_responses = []
+        last_run = None
+        result = db.execute(page_stmt, execution_options={"yield_per": RUN_LIST_BATCH_SIZE})
+        for batch in result.partitions():
+            # One compiled validator call per batch instead of one per row
+            run_responses.extend(_RUN_LIST_ADAPTER.validate_python(batch, from_attributes=True))
+            last_run = batch[-1]
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
         return WorkflowRunListResponse(
             runs=run_responses,
-            total=len(run_responses),
+            total=total,
             failed_runs=failed_runs,
             successful_runs=successful_runs,
+            next_cursor=_encode_run_cursor(last_run) if len(run_responses) == limit else None,
         )
 
     except HTTPException:
@@ -154,7 +316,7 @@ async def list_workflow_runs(
     description="Get details of a specific workflow run.",
 )
 async def get_workflow_run(
-    run_id: str,
+    run_id: str = Path(..., pattern=_RUN_ID_PATTERN, description="Workflow run tracking ID"),
     db: Session = Depends(get_db),
     current_user_data: dict = Depends(get_current_active_user),
 ) -> WorkflowRunResponse:
@@ -170,20 +332,9 @@ async def get_workflow_run(
     try:
         user = current_user_data["user"]
 
-        from app.adapters.database.postgres.models import WorkflowRunTable
-
-        run = (
-            db.query(WorkflowRunTable)
-            .join(
-                RepositoryConnectionTable,
-                WorkflowRunTable.repository_connection_id == RepositoryConnectionTable.id,
-            )
-            .filter(
-                WorkflowRunTable.id == run_id,
-                RepositoryConnectionTable.user_id == user.user_id,
-            )
-            .first()
-        )
+        stmt = _scoped_to_user(lambda_stmt(lambda: select(*_RUN_RESPONSE_FIELDS)), user.user_id)
+        stmt += lambda s: s.where(WorkflowRunTable.id == run_id)
+        run = db.execute(stmt).first()
 
         if not run:
             raise HTTPException(
@@ -191,7 +342,7 @@ async def get_workflow_run(
                 detail="Workflow run not found"
             )
 
-        return WorkflowRunResponse.from_orm(run)
+        return WorkflowRunResponse.model_validate(run._asdict())
 
     except HTTPException:
         raise
@@ -215,9 +366,12 @@ async def get_workflow_run(
     description="Get workflow run statistics for user's repositories.",
 )
 async def get_workflow_stats(
+    request: Request,
+    response: Response,
     repository_connection_id: Optional[str] = Query(None, description="Filter by repository connection"),
     db: Session = Depends(get_db),
     current_user_data: dict = Depends(get_current_active_user),
+    tracker: WorkflowTracker = Depends(get_workflow_tracker),
 ) -> WorkflowRunStatsResponse:
     """
     Get workflow run statistics.
@@ -229,17 +383,46 @@ async def get_workflow_stats(
     - Total runs, failed runs, successful runs
     - In-progress runs, average duration
     - Failure rate, repositories tracked
+    - ETag; repeat polls sending it in If-None-Match get 304 while nothing changed
     """
     try:
         user = current_user_data["user"]
-        tracker = get_workflow_tracker()
+        user_id = user.user_id
+
+        # Cheap fingerprint of everything the statistics depend on, so repeat
+        # dashboard polls skip the full aggregate
+        fingerprint_stmt = _in_user_repositories(
+            lambda_stmt(
+                lambda: select(
+                    func.count(WorkflowRunTable.id),
+                    func.max(WorkflowRunTable.updated_at),
+                    select(func.count(RepositoryConnectionTable.id))
+                    .where(
+                        RepositoryConnectionTable.user_id == user_id,
+                        RepositoryConnectionTable.is_enabled == True,
+                    )
+                    .scalar_subquery(),
+                )
+            ),
+            user_id,
+        )
+        if repository_connection_id:
+            fingerprint_stmt += lambda s: s.where(
+                WorkflowRunTable.repository_connection_id == repository_connection_id
+            )
+
+        etag = _runs_etag(user_id, repository_connection_id, *db.execute(fingerprint_stmt).one())
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
 
         stats = await tracker.get_workflow_run_stats(
             db=db,
-            user_id=user.user_id,
+            user_id=user_id,
             repository_connection_id=repository_connection_id,
         )
 
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
         return WorkflowRunStatsResponse(**stats)
 
     except Exception as e:
@@ -261,10 +444,11 @@ async def get_workflow_stats(
     description="Trigger a rerun of a workflow run.",
 )
 async def rerun_workflow(
-    run_id: str,
     request: WorkflowRetryRequest,
+    run_id: str = Path(..., pattern=_RUN_ID_PATTERN, description="Workflow run tracking ID"),
     db: Session = Depends(get_db),
     current_user_data: dict = Depends(get_current_active_user),
+    tracker: WorkflowTracker = Depends(get_workflow_tracker),
 ) -> dict:
     """
     Rerun a workflow run.
@@ -280,46 +464,37 @@ async def rerun_workflow(
     """
     try:
         user = current_user_data["user"]
-        tracker = get_workflow_tracker()
-
-        from app.adapters.database.postgres.models import WorkflowRunTable
 
-        # Get workflow run
-        run = (
-            db.query(WorkflowRunTable)
-            .join(
-                RepositoryConnectionTable,
-                WorkflowRunTable.repository_connection_id == RepositoryConnectionTable.id,
-            )
-            .filter(
-                WorkflowRunTable.id == run_id,
-                RepositoryConnectionTable.user_id == user.user_id,
-            )
-            .first()
+        # Get workflow run, its repository and the user's GitHub OAuth connection
+        # in one round-trip; they are independent lookups on the same session.
+        stmt = _scoped_to_user(
+            lambda_stmt(
+                lambda: select(
+                    WorkflowRunTable.run_id,
+                    WorkflowRunTable.run_number,
+                    RepositoryConnectionTable.repository_full_name,
+                    OAuthConnectionTable,
+                )
+            ),
+            user.user_id,
         )
-
-        if not run:
+        stmt += lambda s: s.outerjoin(
+            OAuthConnectionTable,
+            and_(
+                OAuthConnectionTable.user_id == RepositoryConnectionTable.user_id,
+                OAuthConnectionTable.provider == "github",
+                OAuthConnectionTable.is_active == True,
+            ),
+        ).where(WorkflowRunTable.id == run_id)
+        row = db.execute(stmt).first()
+
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Workflow run not found"
             )
 
-        # Get repository connection for OAuth token
-        repo_conn = (
-            db.query(RepositoryConnectionTable)
-            .filter(RepositoryConnectionTable.id == run.repository_connection_id)
-            .first()
-        )
-
-        # Get OAuth token
-        from app.services.oauth.token_manager import get_token_manager
-        token_manager = get_token_manager(settings.oauth_token_encryption_key)
-
-        oauth_conn = await token_manager.get_oauth_connection(
-            db=db,
-            user_id=user.user_id,
-            provider="github",
-        )
+        github_run_id, run_number, repository_full_name, oauth_conn = row
 
         if not oauth_conn:
             raise HTTPException(
@@ -327,17 +502,21 @@ async def rerun_workflow(
                 detail="No GitHub OAuth connection found"
             )
 
-        access_token = token_manager.get_decrypted_token(oauth_conn)
+        # Same bookkeeping TokenManager.get_oauth_connection does; committed with the request
+        oauth_conn.last_used_at = datetime.now(timezone.utc)
+
+        # Get OAuth token
+        access_token = tracker.token_manager.get_decrypted_token(oauth_conn)
 
         # Split repository full name
-        owner, repo = repo_conn.repository_full_name.split("/")
+        owner, repo = repository_full_name.split("/")
 
         # Trigger rerun
         success = await tracker.rerun_workflow(
             access_token=access_token,
             owner=owner,
             repo=repo,
-            run_id=int(run.run_id),
+            run_id=int(github_run_id),
             rerun_failed_jobs=request.retry_failed_jobs,
         )
 
@@ -351,14 +530,14 @@ async def rerun_workflow(
             "workflow_rerun_triggered",
             user_id=user.user_id,
             run_id=run_id,
-            github_run_id=run.run_id,
+            github_run_id=github_run_id,
         )
 
         return {
             "success": True,
-            "message": f"Workflow rerun triggered for run #{run.run_number}",
+            "message": f"Workflow rerun triggered for run #{run_number}",
             "run_id": run_id,
-            "github_run_id": run.run_id,
+            "github_run_id": github_run_id,
         }
 
     except HTTPException:
@@ -373,3 +552,139 @@ async def rerun_workflow(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to rerun workflow: {str(e)}"
         )
+
+
+@router.post(
+    "/runs/rerun",
+    response_model=WorkflowBulkRetryResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Rerun Workflows",
+    description="Trigger reruns for several workflow runs at once.",
+)
+async def rerun_workflows(
+    request: WorkflowBulkRetryRequest,
+    db: Session = Depends(get_db),
+    current_user_data: dict = Depends(get_current_active_user),
+    tracker: WorkflowTracker = Depends(get_workflow_tracker),
+) -> WorkflowBulkRetryResponse:
+    """
+    Rerun several workflow runs.
+
+    The runs are loaded in one query, the GitHub token is decrypted once,
+    and the GitHub rerun calls are issued concurrently.
+
+    **Request Body:**
+    - run_ids: Workflow run tracking IDs (1-50)
+    - retry_failed_jobs: If true, only retry failed jobs (default: false)
+
+    **Returns:**
+    - Per-run results in request order, with triggered/failed counts
+    """
+    try:
+        user = current_user_data["user"]
+        run_ids = list(dict.fromkeys(request.run_ids))
+
+        stmt = _scoped_to_user(
+            lambda_stmt(
+                lambda: select(
+                    WorkflowRunTable.id,
+                    WorkflowRunTable.run_id,
+                    RepositoryConnectionTable.repository_full_name,
+                    OAuthConnectionTable,
+                )
+            ),
+            user.user_id,
+        )
+        stmt += lambda s: s.outerjoin(
+            OAuthConnectionTable,
+            and_(
+                OAuthConnectionTable.user_id == RepositoryConnectionTable.user_id,
+                OAuthConnectionTable.provider == "github",
+                OAuthConnectionTable.is_active == True,
+            ),
+        ).where(WorkflowRunTable.id.in_(run_ids))
+        rows = db.execute(stmt).all()
+
+        if not rows:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Workflow runs not found"
+            )
+
+        # Every row carries the same per-user connection
+        oauth_conn = rows[0][3]
+        if not oauth_conn:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No GitHub OAuth connection found"
+            )
+
+        oauth_conn.last_used_at = datetime.now(timezone.utc)
+        access_token = tracker.token_manager.get_decrypted_token(oauth_conn)
+
+        found = {run_id: (github_run_id, full_name) for run_id, github_run_id, full_name, _ in rows}
+
+        async def _rerun(github_run_id: str, repository_full_name: str) -> bool:
+            owner, repo = repository_full_name.split("/")
+            return await tracker.rerun_workflow(
+                access_token=access_token,
+                owner=owner,
+                repo=repo,
+                run_id=int(github_run_id),
+                rerun_failed_jobs=request.retry_failed_jobs,
+            )
+
+        outcomes = dict(zip(
+            found,
+            await asyncio.gather(
+                *(_rerun(*target) for target in found.values()),
+                return_exceptions=True,
+            ),
+        ))
+
+        results = []
+        for run_id in run_ids:
+            if run_id not in found:
+                results.append(WorkflowRetryResult(
+                    run_id=run_id, success=False, message="Workflow run not found"
+                ))
+                continue
+
+            outcome = outcomes[run_id]
+            if isinstance(outcome, Exception):
+                logger.warning("bulk_rerun_workflow_error", run_id=run_id, error=str(outcome))
+            success = outcome is True
+            results.append(WorkflowRetryResult(
+                run_id=run_id,
+                github_run_id=found[run_id][0],
+                success=success,
+                message="Workflow rerun triggered" if success else "Failed to trigger workflow rerun",
+            ))
+
+        triggered = sum(result.success for result in results)
+
+        logger.info(
+            "workflow_bulk_rerun_triggered",
+            user_id=user.user_id,
+            requested=len(run_ids),
+            triggered=triggered,
+        )
+
+        return WorkflowBulkRetryResponse(
+            results=results,
+            triggered=triggered,
+            failed=len(results) - triggered,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            "rerun_workflows_error",
+            error=str(e),
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to rerun workflows: {str(e)}"
+        )
@@ -19,6 +19,7 @@ from app.auth.zitadel import (
     get_current_active_analytics_user,
     get_optional_user,
     require_admin,
+    invalidate_active_user_cache,
     ZitadelUser,
     ZitadelAuth,
 )
@@ -31,6 +32,7 @@ __all__ = [
     "get_current_active_analytics_user",
     "get_optional_user",
     "require_admin",
+    "invalidate_active_user_cache",
     # Classes
     "ZitadelUser",
     "ZitadelAuth",
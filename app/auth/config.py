@@ -7,10 +7,13 @@ Zitadel Configuration
 Settings for Zitadel OIDC integration.
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
+from app.core.config import ENV_FILE
+
 
 class ZitadelSettings(BaseSettings):
     """
@@ -54,6 +57,13 @@ class ZitadelSettings(BaseSettings):
         description="API audience for token validation"
     )
 
+    # Zitadel API URL (defaults to issuer if not set)
+    api_url: Optional[str] = Field(
+        default=None,
+        alias="ZITADEL_API_URL",
+        description="Zitadel API URL (defaults to issuer if not set)"
+    )
+
     # JWKS cache duration in seconds
     jwks_cache_ttl: int = Field(
         default=3600,
@@ -103,39 +113,42 @@ class ZitadelSettings(BaseSettings):
     )
 
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
     )
 
-    @property
+    # Endpoint URIs derive only from the issuer, so they are computed once per
+    # instance rather than on every access from the auth path.
+
+    @cached_property
     def jwks_uri(self) -> str:
         """Get JWKS URI from issuer."""
         # Zitadel uses /oauth/v2/keys instead of /.well-known/jwks.json
         return f"{self.issuer.rstrip('/')}/oauth/v2/keys"
 
-    @property
+    @cached_property
     def openid_config_uri(self) -> str:
         """Get OpenID configuration URI."""
         return f"{self.issuer.rstrip('/')}/.well-known/openid-configuration"
 
-    @property
+    @cached_property
     def userinfo_uri(self) -> str:
         """Get userinfo endpoint URI."""
         return f"{self.issuer.rstrip('/')}/oidc/v1/userinfo"
 
-    @property
+    @cached_property
     def introspection_uri(self) -> str:
         """Get token introspection endpoint URI."""
         return f"{self.issuer.rstrip('/')}/oauth/v2/introspect"
 
-    @property
+    @cached_property
     def management_api_uri(self) -> str:
         """Get Management API base URI."""
         return f"{self.issuer.rstrip('/')}/management/v1"
 
-    @property
+    @cached_property
     def auth_api_uri(self) -> str:
         """Get Auth API base URI (for user's own data)."""
         return f"{self.issuer.rstrip('/')}/auth/v1"
@@ -9,38 +9,74 @@ Optimized with TTLCache, persistent HTTP client, and lazy DB sync.
 """
 
 import asyncio
+import hashlib
+import math
+import time
 from datetime import datetime, timezone, timedelta
 from types import SimpleNamespace
 from typing import Optional, Annotated
 from dataclasses import dataclass, field
+from functools import lru_cache
 import httpx
+import orjson
 import structlog
-from cachetools import TTLCache
+from cachetools import TLRUCache, TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import Boolean, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.auth.config import get_zitadel_settings, ZitadelSettings
 from app.adapters.cache.redis import get_redis_cache
+from app.core.config import settings
 from app.dependencies import get_db
 from app.adapters.database.postgres.models import UserTable, UserDetailsTable
+from app.adapters.database.postgres.write_behind import TimestampWriteBuffer
 
 logger = structlog.get_logger(__name__)
 
+# Hot-path debug logs are skipped outright unless debug logging is on
+_DEBUG_LOGGING = settings.log_level == "DEBUG"
+
 # Global persistent HTTP client for connection pooling
 _http_client: Optional[httpx.AsyncClient] = None
 
+# Throttled last_login_at bumps, written in bulk off the request path
+login_buffer = TimestampWriteBuffer(UserTable, "user_id", "last_login_at")
+
 # Last login update throttle interval (avoid updating on every request)
 LAST_LOGIN_UPDATE_INTERVAL = timedelta(minutes=5)
 ANALYTICS_ACTIVE_USER_CACHE_TTL_SECONDS = 120
 USERINFO_CACHE_TTL_SECONDS = 600
+# Cached userinfo older than this is still served, but revalidated in the background
+USERINFO_REFRESH_AFTER_SECONDS = 300
+INVALID_TOKEN_CACHE_TTL_SECONDS = 30
+# Shorter bearer values cannot be Zitadel access tokens
+MIN_TOKEN_LENGTH = 20
+# Userinfo statuses that are final for a token; 408/429 and 5xx are transient
+_AUTH_FATAL_STATUS_CODES = frozenset({400, 401, 403})
+
+# Userinfo claims the app reads; everything else is dropped before caching
+_CACHED_CLAIM_KEYS = frozenset({
+    "sub",
+    "email",
+    "email_verified",
+    "name",
+    "given_name",
+    "family_name",
+    "preferred_username",
+    "picture",
+    "locale",
+    "exp",
+})
 
 # Security scheme for OpenAPI docs
 security = HTTPBearer(auto_error=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ZitadelUser:
     """
     Represents an authenticated Zitadel user.
@@ -81,16 +117,21 @@ class ZitadelUser:
     # Database user record (populated after DB lookup)
     db_user: Optional[UserTable] = None
 
+    # Full name (name claim, else given + family name; set in __post_init__)
+    full_name: str = field(init=False, default="")
+
+    # Best available display name (set in __post_init__)
+    display_name: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.full_name = self.name or f"{self.given_name} {self.family_name}".strip()
+        self.display_name = self.name or self.preferred_username or (self.email or "").split("@")[0]
+
     @property
     def user_id(self) -> str:
         """Alias for sub (Zitadel user ID)."""
         return self.sub
 
-    @property
-    def display_name(self) -> str:
-        """Get best available display name."""
-        return self.name or self.preferred_username or self.email.split("@")[0]
-
     @classmethod
     def from_claims(cls, claims: dict) -> "ZitadelUser":
         """
@@ -129,7 +170,7 @@ async def get_http_client() -> httpx.AsyncClient:
             limits=httpx.Limits(
                 max_keepalive_connections=20,
                 max_connections=100,
-                keepalive_expiry=30.0,
+                keepalive_expiry=75.0,
             ),
         )
         logger.info("http_client_created", pool_size=20)
@@ -145,8 +186,45 @@ async def close_http_client() -> None:
         logger.info("http_client_closed")
 
 
-def _userinfo_cache_key(token: str) -> str:
-    return f"auth:userinfo:{token}"
+async def warm_http_client() -> None:
+    """
+    Open a pooled connection to Zitadel before the first request needs it.
+
+    Fetches the public OpenID configuration so DNS, TCP and TLS setup
+    happen at startup. Failures are logged and otherwise ignored.
+    """
+    settings = get_zitadel_settings()
+    if not settings.issuer:
+        return
+
+    client = await get_http_client()
+    try:
+        await client.get(settings.openid_config_uri, timeout=5.0)
+        logger.info("http_client_warmed", issuer=settings.issuer)
+    except httpx.HTTPError as exc:
+        logger.warning("http_client_warmup_failed", error=str(exc))
+
+
+def _token_cache_key(token: str, userinfo_uri: str = "") -> str:
+    """
+    Hash a bearer token so raw credentials are never used as cache keys.
+
+    The userinfo URI is mixed in so deployments for different Zitadel
+    instances sharing one Redis never see each other's entries.
+    """
+    return hashlib.sha256(f"{userinfo_uri}\0{token}".encode()).hexdigest()
+
+
+def _userinfo_ttl(claims: dict) -> float:
+    """Seconds a userinfo result may be cached, capped by the token's exp claim."""
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        return max(1.0, min(USERINFO_CACHE_TTL_SECONDS, exp - time.time()))
+    return USERINFO_CACHE_TTL_SECONDS
+
+
+def _userinfo_cache_key(token_key: str) -> str:
+    return f"auth:userinfo:{token_key}"
 
 
 def _active_user_cache_key(user_id: str) -> str:
@@ -170,6 +248,13 @@ async def _set_redis_json(key: str, payload: dict, ttl: int) -> None:
         logger.warning("redis_auth_cache_write_failed", key=key, error=str(exc))
 
 
+async def _delete_redis_key(key: str) -> None:
+    try:
+        await get_redis_cache().delete(key)
+    except Exception as exc:
+        logger.warning("redis_auth_cache_delete_failed", key=key, error=str(exc))
+
+
 class ZitadelAuth:
     """
     Zitadel authentication handler for PKCE/Public Client applications.
@@ -178,26 +263,49 @@ class ZitadelAuth:
     This works with public clients (User Agent apps) that use PKCE.
 
     Optimizations:
-    - TTLCache with 600s TTL (10 minutes)
+    - TLRUCache with up to 600s TTL (10 minutes), capped at token expiry
     - Persistent HTTP client with connection pooling
+    - 30s negative cache for tokens Zitadel rejected
+    - Stale-while-revalidate: entries older than 300s are served while a
+      background refresh runs, so upstream latency and short outages stay
+      off the request path
     """
 
     def __init__(self, settings: ZitadelSettings):
         self.settings = settings
-        # TTLCache: max 10,000 entries, 600 second TTL
-        self._userinfo_cache: TTLCache = TTLCache(maxsize=10000, ttl=600)
+        # Bound once so the hot path skips settings attribute access
+        self._userinfo_uri = settings.userinfo_uri
+        # TLRUCache: max 10,000 entries, up to 600 seconds but never past
+        # the token's own expiry
+        self._userinfo_cache: TLRUCache = TLRUCache(
+            maxsize=10000,
+            ttu=lambda _key, claims, now: now + _userinfo_ttl(claims),
+        )
+        # Keys present here were (re)validated recently; a cached entry
+        # without one is stale and gets refreshed in the background
+        self._userinfo_fresh: TTLCache = TTLCache(
+            maxsize=10000,
+            ttl=USERINFO_REFRESH_AFTER_SECONDS,
+        )
+        self._userinfo_refreshes: set[asyncio.Task] = set()
         self._active_user_cache: TTLCache = TTLCache(
             maxsize=10000,
             ttl=ANALYTICS_ACTIVE_USER_CACHE_TTL_SECONDS,
         )
+        # Negative cache: tokens Zitadel rejected, so floods of bad tokens
+        # do not turn into one upstream call each
+        self._invalid_token_cache: TTLCache = TTLCache(
+            maxsize=50000,
+            ttl=INVALID_TOKEN_CACHE_TTL_SECONDS,
+        )
         self._userinfo_inflight: dict[str, asyncio.Task] = {}
         self._userinfo_lock = asyncio.Lock()
 
-    async def _fetch_userinfo(self, token: str) -> dict:
-        """Fetch userinfo from Zitadel and populate the local TTL cache."""
+    async def _fetch_userinfo(self, token: str, token_key: str) -> dict:
+        """Fetch userinfo from Zitadel and populate the TTL caches under the token hash."""
         client = await get_http_client()
         response = await client.get(
-            self.settings.userinfo_uri,
+            self._userinfo_uri,
             headers={
                 "Authorization": f"Bearer {token}",
                 "Accept": "application/json",
@@ -205,6 +313,7 @@ class ZitadelAuth:
         )
 
         if response.status_code == 401:
+            self._invalid_token_cache[token_key] = True
             logger.warning(
                 "userinfo_unauthorized",
                 token_preview=token[:20] + "...",
@@ -216,6 +325,8 @@ class ZitadelAuth:
             )
 
         if response.status_code != 200:
+            if response.status_code in _AUTH_FATAL_STATUS_CODES:
+                self._invalid_token_cache[token_key] = True
             logger.warning(
                 "userinfo_request_failed",
                 status_code=response.status_code,
@@ -227,8 +338,9 @@ class ZitadelAuth:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        result = response.json()
+        result = orjson.loads(response.content)
         if not result.get("sub"):
+            self._invalid_token_cache[token_key] = True
             logger.warning("userinfo_missing_sub", result=result)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -241,14 +353,48 @@ class ZitadelAuth:
             sub=result.get("sub"),
             email=result.get("email"),
         )
-        self._userinfo_cache[token] = result
+        result = {key: value for key, value in result.items() if key in _CACHED_CLAIM_KEYS}
+        self._userinfo_cache[token_key] = result
+        self._userinfo_fresh[token_key] = True
         await _set_redis_json(
-            _userinfo_cache_key(token),
+            _userinfo_cache_key(token_key),
             result,
-            ttl=USERINFO_CACHE_TTL_SECONDS,
+            ttl=math.ceil(_userinfo_ttl(result)),
         )
         return result
 
+    async def _resolve_userinfo(self, token: str, token_key: str) -> dict:
+        """Resolve a local cache miss from Redis, falling back to Zitadel."""
+        cached = await _get_redis_json(_userinfo_cache_key(token_key))
+        if cached:
+            self._userinfo_cache[token_key] = cached
+            self._userinfo_fresh[token_key] = True
+            if _DEBUG_LOGGING:
+                logger.debug("userinfo_redis_cache_hit", sub=cached.get("sub"))
+            return cached
+
+        return await self._fetch_userinfo(token, token_key)
+
+    async def _refresh_userinfo(self, token: str, token_key: str) -> None:
+        """Revalidate a stale cache entry, dropping it if Zitadel now rejects the token."""
+        try:
+            await self._fetch_userinfo(token, token_key)
+        except HTTPException:
+            if token_key in self._invalid_token_cache:
+                self._userinfo_cache.pop(token_key, None)
+                await _delete_redis_key(_userinfo_cache_key(token_key))
+                logger.info("userinfo_revoked_on_refresh")
+        except Exception as exc:
+            # Keep serving the cached entry until it hard-expires
+            logger.warning("userinfo_refresh_failed", error=str(exc))
+
+    def _schedule_userinfo_refresh(self, token: str, token_key: str) -> None:
+        # Marked fresh up front so concurrent hits schedule only one refresh
+        self._userinfo_fresh[token_key] = True
+        task = asyncio.create_task(self._refresh_userinfo(token, token_key))
+        self._userinfo_refreshes.add(task)
+        task.add_done_callback(self._userinfo_refreshes.discard)
+
     async def get_userinfo(self, token: str) -> dict:
         """
         Validate token using Zitadel's userinfo endpoint.
@@ -256,7 +402,12 @@ class ZitadelAuth:
         This validates opaque tokens by calling Zitadel's userinfo API.
         Works with PKCE/public client applications (no client secret needed).
 
-        Uses TTLCache (600s TTL) and persistent HTTP client for performance.
+        Uses TLRUCache (up to 600s, capped at the token's exp) and a persistent
+        HTTP client for performance. Hits older than 300s are returned as-is
+        while a background task revalidates them.
+        Caches are keyed by the SHA-256 of the token, never the token itself.
+        Concurrent misses for one token share a single Redis read and, if
+        needed, a single Zitadel call.
 
         Args:
             token: Access token string (opaque)
@@ -274,32 +425,39 @@ class ZitadelAuth:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Check TTLCache first (automatic expiry after 600s)
-        cached = self._userinfo_cache.get(token)
-        if cached:
-            logger.debug("userinfo_cache_hit", sub=cached.get("sub"))
-            return cached
+        token_key = _token_cache_key(token, self._userinfo_uri)
 
-        cached = await _get_redis_json(_userinfo_cache_key(token))
+        # Check the local cache first (expires at 600s or token exp)
+        cached = self._userinfo_cache.get(token_key)
         if cached:
-            self._userinfo_cache[token] = cached
-            logger.debug("userinfo_redis_cache_hit", sub=cached.get("sub"))
+            if _DEBUG_LOGGING:
+                logger.debug("userinfo_cache_hit", sub=cached.get("sub"))
+            if token_key not in self._userinfo_fresh:
+                self._schedule_userinfo_refresh(token, token_key)
             return cached
 
+        if token_key in self._invalid_token_cache:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
         try:
             async with self._userinfo_lock:
-                cached = self._userinfo_cache.get(token)
+                cached = self._userinfo_cache.get(token_key)
                 if cached:
-                    logger.debug("userinfo_cache_hit_after_lock", sub=cached.get("sub"))
+                    if _DEBUG_LOGGING:
+                        logger.debug("userinfo_cache_hit_after_lock", sub=cached.get("sub"))
                     return cached
 
-                inflight = self._userinfo_inflight.get(token)
+                inflight = self._userinfo_inflight.get(token_key)
                 created_task = False
                 if inflight is None:
-                    inflight = asyncio.create_task(self._fetch_userinfo(token))
-                    self._userinfo_inflight[token] = inflight
+                    inflight = asyncio.create_task(self._resolve_userinfo(token, token_key))
+                    self._userinfo_inflight[token_key] = inflight
                     created_task = True
-                else:
+                elif _DEBUG_LOGGING:
                     logger.debug("userinfo_inflight_wait", token_preview=token[:12] + "...")
 
             try:
@@ -307,8 +465,8 @@ class ZitadelAuth:
             finally:
                 if created_task:
                     async with self._userinfo_lock:
-                        if self._userinfo_inflight.get(token) is inflight:
-                            self._userinfo_inflight.pop(token, None)
+                        if self._userinfo_inflight.get(token_key) is inflight:
+                            self._userinfo_inflight.pop(token_key, None)
 
         except HTTPException:
             raise
@@ -356,17 +514,10 @@ class ZitadelAuth:
         return ZitadelUser.from_claims(claims)
 
 
-# Global auth instance (lazy initialized)
-_auth_instance: Optional[ZitadelAuth] = None
-
-
+@lru_cache()
 def get_auth() -> ZitadelAuth:
-    """Get or create ZitadelAuth instance."""
-    global _auth_instance
-    if _auth_instance is None:
-        settings = get_zitadel_settings()
-        _auth_instance = ZitadelAuth(settings)
-    return _auth_instance
+    """Get cached ZitadelAuth instance."""
+    return ZitadelAuth(get_zitadel_settings())
 
 
 def _build_db_user_snapshot(db_user: UserTable) -> dict:
@@ -390,6 +541,9 @@ def _build_db_user_snapshot(db_user: UserTable) -> dict:
 async def _cache_active_user_snapshot(user_id: str, db_user: UserTable) -> None:
     auth = get_auth()
     snapshot = _build_db_user_snapshot(db_user)
+    if auth._active_user_cache.get(user_id) == snapshot:
+        # Unchanged since the last write, so Redis already holds it too.
+        return
     auth._active_user_cache[user_id] = snapshot
     await _set_redis_json(
         _active_user_cache_key(user_id),
@@ -398,6 +552,20 @@ async def _cache_active_user_snapshot(user_id: str, db_user: UserTable) -> None:
     )
 
 
+async def invalidate_active_user_cache(user_id: str) -> None:
+    """
+    Drop the cached active-user snapshot for a user.
+
+    Call after changing a user's role or active flag so analytics routes
+    stop serving the old snapshot before its TTL runs out.
+
+    Args:
+        user_id: Zitadel user ID
+    """
+    get_auth()._active_user_cache.pop(user_id, None)
+    await _delete_redis_key(_active_user_cache_key(user_id))
+
+
 async def _get_cached_active_user_snapshot(user_id: str) -> Optional[dict]:
     cached = get_auth()._active_user_cache.get(user_id)
     if cached:
@@ -434,75 +602,91 @@ async def get_current_user(
     return await auth.get_user_from_token(credentials.credentials)
 
 
-async def get_current_active_user(
-    user: ZitadelUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> dict:
+def _sync_db_user(db: Session, user: ZitadelUser) -> UserTable:
     """
-    FastAPI dependency to get current user with database record.
+    Find or create the database user for a Zitadel user and sync its profile.
 
-    This dependency:
-    1. Validates the Zitadel token
-    2. Finds or creates the user in the database
-    3. Returns both the Zitadel user info and database record
+    Runs blocking Session I/O, so async callers should run it in a worker
+    thread.
 
-    Optimizations:
-    - Lazy DB sync: Only commits when data actually changes
-    - Throttled last_login: Updates only every 5 minutes
+    Args:
+        db: Database session
+        user: Authenticated Zitadel user
 
-    Usage:
-        @router.get("/profile")
-        async def get_profile(current_user: dict = Depends(get_current_active_user)):
-            user = current_user["user"]  # ZitadelUser
-            db_user = current_user["db_user"]  # UserTable
+    Returns:
+        The session-bound UserTable row
     """
-    # Find or create user in database
-    db_user = db.query(UserTable).filter(
-        UserTable.user_id == user.sub
-    ).first()
+    # Find or create user in database (user_id is the primary key, so this
+    # is served from the session identity map when already loaded)
+    db_user = db.get(UserTable, user.sub)
 
     now = datetime.now(timezone.utc)
     needs_commit = False
 
     if not db_user:
-        # Auto-create user on first login
-        db_user = UserTable(
+        # Auto-create user on first login. Upserts so the parallel requests
+        # a client fires right after sign-in converge on one row instead of
+        # racing into a primary key violation.
+        insert_stmt = pg_insert(UserTable).values(
             user_id=user.sub,
             email=user.email,
-            full_name=user.name or f"{user.given_name} {user.family_name}".strip(),
+            full_name=user.full_name,
             avatar_url=user.picture,
             is_active=True,
             is_verified=user.email_verified,
             oauth_provider="zitadel",
             oauth_id=user.sub,
+            # Core inserts skip the model's default factories for JSON columns
+            preferences={},
+            allowed_repositories=[],
+            allowed_namespaces=[],
+            allowed_services=[],
             created_at=now,
             updated_at=now,
             last_login_at=now,
         )
-        db.add(db_user)
-        # Flush parent row first so the user_details FK can resolve reliably.
-        db.flush()
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[UserTable.user_id],
+            set_={
+                "email": insert_stmt.excluded.email,
+                "full_name": insert_stmt.excluded.full_name,
+                "avatar_url": insert_stmt.excluded.avatar_url,
+                "is_verified": insert_stmt.excluded.is_verified,
+                "updated_at": insert_stmt.excluded.updated_at,
+                "last_login_at": insert_stmt.excluded.last_login_at,
+            },
+        ).returning(
+            UserTable,
+            # xmax is 0 only for a freshly inserted tuple, not a DO UPDATE
+            literal_column("xmax = 0", Boolean).label("inserted"),
+        )
+        db_user, inserted = db.execute(
+            upsert_stmt,
+            execution_options={"populate_existing": True},
+        ).one()
 
         # Auto-create empty user_details row
-        user_details = UserDetailsTable(
-            user_id=user.sub,
-            created_at=now,
-            updated_at=now,
+        db.execute(
+            pg_insert(UserDetailsTable).values(
+                user_id=user.sub,
+                created_at=now,
+                updated_at=now,
+            ).on_conflict_do_nothing(index_elements=[UserDetailsTable.user_id])
         )
-        db.add(user_details)
         needs_commit = True
 
-        logger.info(
-            "user_auto_created",
-            user_id=user.sub,
-            email=user.email,
-        )
+        if inserted:
+            logger.info(
+                "user_auto_created",
+                user_id=user.sub,
+                email=user.email,
+            )
     else:
         # Lazy sync: Only update fields that actually changed
         fields_updated = False
 
         # Sync these fields from Zitadel (source of truth)
-        new_full_name = user.name or f"{user.given_name} {user.family_name}".strip()
+        new_full_name = user.full_name
 
         if db_user.email != user.email:
             db_user.email = user.email
@@ -531,8 +715,8 @@ async def get_current_active_user(
         )
 
         if should_update_last_login:
-            db_user.last_login_at = now
-            needs_commit = True
+            # Written behind by the write-behind flusher, off the request path
+            login_buffer.record(user.sub, now)
 
         if fields_updated:
             db_user.updated_at = now
@@ -543,31 +727,65 @@ async def get_current_active_user(
                 email=user.email,
             )
 
-        # Ensure user_details exists for existing users (backfill)
-        user_details = db.query(UserDetailsTable).filter(
-            UserDetailsTable.user_id == user.sub
-        ).first()
-        if not user_details:
-            user_details = UserDetailsTable(
-                user_id=user.sub,
-                created_at=now,
-                updated_at=now,
-            )
-            db.add(user_details)
-            needs_commit = True
-            logger.info(
-                "user_details_backfilled",
-                user_id=user.sub,
-            )
+        # Ensure user_details exists for existing users (backfill). Only
+        # checked on the throttled login bump or when the row is being
+        # written anyway, so steady-state requests stay a single SELECT.
+        if needs_commit or should_update_last_login:
+            has_details = db.query(
+                db.query(UserDetailsTable.user_id).filter(
+                    UserDetailsTable.user_id == user.sub
+                ).exists()
+            ).scalar()
+            if not has_details:
+                db.add(UserDetailsTable(
+                    user_id=user.sub,
+                    created_at=now,
+                    updated_at=now,
+                ))
+                needs_commit = True
+                logger.info(
+                    "user_details_backfilled",
+                    user_id=user.sub,
+                )
 
     # Only commit if something changed
     if needs_commit:
         db.commit()
-        if not db_user.user_id:
-            db.refresh(db_user)
+
+    return db_user
+
+
+async def get_current_active_user(
+    user: ZitadelUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> dict:
+    """
+    FastAPI dependency to get current user with database record.
+
+    This dependency:
+    1. Validates the Zitadel token
+    2. Finds or creates the user in the database
+    3. Returns both the Zitadel user info and database record
+
+    Optimizations:
+    - Lazy DB sync: Only commits when data actually changes
+    - Throttled last_login: Buffered every 5 minutes, written in bulk
+    - Single commit: Profile sync and details backfill share one commit;
+      last_login is written behind
+    - Worker thread: Blocking DB sync does not stall the event loop
+
+    Usage:
+        @router.get("/profile")
+        async def get_profile(current_user: dict = Depends(get_current_active_user)):
+            user = current_user["user"]  # ZitadelUser
+            db_user = current_user["db_user"]  # UserTable
+    """
+    # Blocking DB sync runs off the event loop
+    db_user = await asyncio.to_thread(_sync_db_user, db, user)
 
     # Check if user is active
     if not db_user.is_active:
+        await invalidate_active_user_cache(user.sub)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is deactivated",
@@ -631,7 +849,9 @@ async def get_optional_user(
                 return {"message": f"Hello, {user.name}"}
             return {"message": "Hello, guest"}
     """
-    if not credentials:
+    # Obvious junk (stale cookies, placeholders) can never validate, so skip
+    # the cache lookup and exception path for it on public routes
+    if not credentials or len(credentials.credentials) < MIN_TOKEN_LENGTH:
         return None
 
     try:
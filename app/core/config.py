@@ -1,14 +1,23 @@
 # Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
 # DevFlowFix - Autonomous AI agent the detects, analyzes, and resolves CI/CD failures in real-time.
 
-from typing import Optional, Any, List
+from typing import TYPE_CHECKING, Optional, Any, List
 from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator, model_validator
+import os
 import secrets
 
 from app.core.enums import Environment, LogLevel
 
+if TYPE_CHECKING:
+    from app.auth.config import ZitadelSettings
+
+# Dotenv file read by every settings class. Defaults to .env for local
+# development; set ENV_FILE to an empty value where the environment is
+# already injected (e.g. containers) so no file is opened at all.
+ENV_FILE: Optional[str] = os.getenv("ENV_FILE", ".env") or None
+
 
 class DatabaseSettings(BaseSettings):
     """Database configuration."""
@@ -21,7 +30,7 @@ class DatabaseSettings(BaseSettings):
     pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -38,7 +47,7 @@ class GitHubSettings(BaseSettings):
     app_installation_id: Optional[str] = Field(default=None, alias="GITHUB_APP_INSTALLATION_ID")
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -57,7 +66,7 @@ class OAuthSettings(BaseSettings):
     github_redirect_uri: Optional[str] = Field(default=None, alias="GITHUB_OAUTH_REDIRECT_URI")
 
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -72,7 +81,7 @@ class AWSSettings(BaseSettings):
     account_id: Optional[str] = Field(default=None, alias="AWS_ACCOUNT_ID")
 
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -89,7 +98,7 @@ class BackblazeSettings(BaseSettings):
     region: str = Field(default="us-west-001", alias="BACKBLAZE_REGION")
 
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -108,7 +117,7 @@ class AISettings(BaseSettings):
     llm_max_tokens: int = Field(default=2000, alias="LLM_MAX_TOKENS")
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -125,7 +134,7 @@ class RedisSettings(BaseSettings):
     socket_timeout: int = Field(default=5, alias="REDIS_SOCKET_TIMEOUT")
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -141,7 +150,7 @@ class ObservabilitySettings(BaseSettings):
     xray_enabled: bool = Field(default=False, alias="XRAY_ENABLED")
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -157,7 +166,7 @@ class SecuritySettings(BaseSettings):
     jwt_expiration_hours: int = Field(default=24, alias="JWT_EXPIRATION_HOURS")
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -174,7 +183,7 @@ class FeatureFlagSettings(BaseSettings):
     enable_learning_mode: bool = Field(default=True, alias="ENABLE_LEARNING_MODE")
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -189,7 +198,7 @@ class ConfidenceSettings(BaseSettings):
     threshold_prod: float = Field(default=0.95, alias="CONFIDENCE_THRESHOLD_PROD")
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -204,54 +213,12 @@ class RateLimitSettings(BaseSettings):
     window: int = Field(default=60, alias="RATE_LIMIT_WINDOW")
 
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
-
-class ZitadelSettings(BaseSettings):
-    """Zitadel OIDC authentication configuration."""
-
-    issuer: str = Field(
-        default="",
-        alias="ZITADEL_ISSUER",
-        description="Zitadel issuer URL (e.g., https://your-instance.zitadel.cloud)"
-    )
-    client_id: str = Field(
-        default="",
-        alias="ZITADEL_CLIENT_ID",
-        description="Zitadel application client ID"
-    )
-    project_id: str = Field(
-        default="",
-        alias="ZITADEL_PROJECT_ID",
-        description="Zitadel project ID for audience validation"
-    )
-    api_url: Optional[str] = Field(
-        default=None,
-        alias="ZITADEL_API_URL",
-        description="Zitadel API URL (defaults to issuer if not set)"
-    )
-    jwks_cache_ttl: int = Field(
-        default=3600,
-        alias="ZITADEL_JWKS_CACHE_TTL",
-        description="JWKS cache TTL in seconds"
-    )
-
-    model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
     )
 
-    @property
-    def is_configured(self) -> bool:
-        """Check if Zitadel is properly configured."""
-        return bool(self.issuer and self.client_id)
-
 
 class Settings(BaseSettings):
     """
@@ -266,7 +233,7 @@ class Settings(BaseSettings):
     """
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -968,9 +935,12 @@ class Settings(BaseSettings):
         return BackblazeSettings()
 
     @property
-    def zitadel(self) -> ZitadelSettings:
-        """Get Zitadel authentication settings."""
-        return ZitadelSettings()
+    def zitadel(self) -> "ZitadelSettings":
+        """Get Zitadel authentication settings (the shared app.auth.config instance)."""
+        # Imported lazily: app.auth pulls in modules that import this one
+        from app.auth.config import get_zitadel_settings
+
+        return get_zitadel_settings()
 
     # Methods
     def get_blast_radius_limit(self, time_window: str = "hour") -> int:
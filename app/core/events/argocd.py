@@ -162,7 +162,7 @@ class ArgoCDSyncEvent(BaseEvent):
             Parsed datetime object
         """
         try:
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+            return datetime.fromisoformat(timestamp_str)
         except Exception:
             return datetime.now(timezone.utc)
     
@@ -170,7 +170,7 @@ class GitHubWorkflowEvent(BaseEvent):
         """
         try:
             # GitHub uses ISO 8601 format: 2024-01-01T12:00:00Z
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+            return datetime.fromisoformat(timestamp_str)
         except Exception:
             return datetime.now(timezone.utc)
     
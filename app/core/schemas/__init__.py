@@ -6,6 +6,10 @@ from app.core.schemas.webhook import (
     WebhookPayload,
     WebhookResponse,
     GitHubWebhookPayload,
+    GitHubWebhookEnvelope,
+    GitHubWorkflowRun,
+    GitHubWorkflowRunEvent,
+    GitLabWebhookEnvelope,
     ArgoCDWebhookPayload,
     KubernetesWebhookPayload,
 )
@@ -80,6 +84,10 @@ __all__ = [
     "WebhookPayload",
     "WebhookResponse",
     "GitHubWebhookPayload",
+    "GitHubWebhookEnvelope",
+    "GitHubWorkflowRun",
+    "GitHubWorkflowRunEvent",
+    "GitLabWebhookEnvelope",
     "ArgoCDWebhookPayload",
     "KubernetesWebhookPayload",
     
@@ -9,11 +9,18 @@ Pydantic models for analytics, metrics, and dashboard data.
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TimeSeriesDataPoint(BaseModel):
-    """Single data point in time series."""
+    """
+    Single data point in time series.
+
+    Analytics services build these in bulk from already-typed values via
+    ``model_construct``, so points are immutable once created.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     timestamp: datetime = Field(..., description="Data point timestamp")
     value: float = Field(..., description="Metric value")
@@ -1,12 +1,24 @@
 # Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
 # DevFlowFix - Autonomous AI agent the detects, analyzes, and resolves CI/CD failures in real-time.
 
-from datetime import datetime
-from typing import Optional, Generic, TypeVar, Any
-from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime, timezone
+from typing import Annotated, Optional, Generic, TypeVar, Any
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict
 
 from app.core.enums import IncidentSource, Severity, Outcome, FailureType
 
+
+def _normalize_utc(value: datetime) -> datetime:
+    """ Convert aware datetimes to the stdlib UTC tzinfo. """
+    if value.tzinfo is None or value.tzinfo is timezone.utc:
+        return value
+    return value.astimezone(timezone.utc)
+
+
+# Naive values pass through; aware ones carry ``datetime.timezone.utc`` rather than
+# pydantic-core's TzInfo, which is much slower to compare and sort against.
+UTCDatetime = Annotated[datetime, AfterValidator(_normalize_utc)]
+
 # Generic type for paginated responses
 T = TypeVar('T')
 
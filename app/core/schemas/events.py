@@ -8,9 +8,9 @@ Pydantic models for calendar event API requests and responses.
 """
 
 from typing import Optional, List
-from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, ConfigDict, Field, field_validator
+from app.core.schemas.common import UTCDatetime
 
 
 class EventColor(str, Enum):
@@ -38,8 +38,8 @@ class EventCreateRequest(BaseModel):
 
     title: str = Field(..., min_length=1, max_length=255, description="Event title")
     color: EventColor = Field(default=EventColor.PRIMARY, description="Event color for calendar display")
-    start_date: datetime = Field(..., description="Event start date")
-    end_date: datetime = Field(..., description="Event end date")
+    start_date: UTCDatetime = Field(..., description="Event start date")
+    end_date: UTCDatetime = Field(..., description="Event end date")
     description: Optional[str] = Field(default=None, max_length=2000, description="Optional event description")
 
     @field_validator('end_date')
@@ -64,8 +64,8 @@ class EventUpdateRequest(BaseModel):
 
     title: Optional[str] = Field(default=None, min_length=1, max_length=255, description="Event title")
     color: Optional[EventColor] = Field(default=None, description="Event color")
-    start_date: Optional[datetime] = Field(default=None, description="Event start date")
-    end_date: Optional[datetime] = Field(default=None, description="Event end date")
+    start_date: Optional[UTCDatetime] = Field(default=None, description="Event start date")
+    end_date: Optional[UTCDatetime] = Field(default=None, description="Event end date")
     description: Optional[str] = Field(default=None, max_length=2000, description="Event description")
 
 class EventResponse(BaseModel):
@@ -92,11 +92,11 @@ class EventResponse(BaseModel):
     user_id: str = Field(..., description="Owner user ID")
     title: str = Field(..., description="Event title")
     color: EventColor = Field(..., description="Event color")
-    start_date: datetime = Field(..., description="Event start date")
-    end_date: datetime = Field(..., description="Event end date")
+    start_date: UTCDatetime = Field(..., description="Event start date")
+    end_date: UTCDatetime = Field(..., description="Event end date")
     description: Optional[str] = Field(default=None, description="Event description")
-    created_at: datetime = Field(..., description="When the event was created")
-    updated_at: datetime = Field(..., description="When the event was last updated")
+    created_at: UTCDatetime = Field(..., description="When the event was created")
+    updated_at: UTCDatetime = Field(..., description="When the event was last updated")
 
 class EventListResponse(BaseModel):
     """Response schema for a list of events."""
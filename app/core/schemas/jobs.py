@@ -5,10 +5,10 @@
 Background job tracking schemas.
 """
 
-from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
 from pydantic import BaseModel, Field
+from app.core.schemas.common import UTCDatetime
 
 
 class JobStatus(str, Enum):
@@ -52,10 +52,10 @@ class JobResponse(BaseModel):
     current_step: Optional[str] = Field(None, description="Current step description")
 
     # Timing
-    created_at: datetime = Field(..., description="When job was created")
-    started_at: Optional[datetime] = Field(None, description="When job started processing")
-    completed_at: Optional[datetime] = Field(None, description="When job completed")
-    estimated_completion: Optional[datetime] = Field(
+    created_at: UTCDatetime = Field(..., description="When job was created")
+    started_at: Optional[UTCDatetime] = Field(None, description="When job started processing")
+    completed_at: Optional[UTCDatetime] = Field(None, description="When job completed")
+    estimated_completion: Optional[UTCDatetime] = Field(
         None,
         description="Estimated completion time"
     )
@@ -77,7 +77,7 @@ class JobProgressUpdate(BaseModel):
     """Schema for updating job progress."""
     progress: int = Field(..., ge=0, le=100, description="Progress percentage")
     current_step: Optional[str] = Field(None, description="Current step description")
-    estimated_completion: Optional[datetime] = Field(None, description="Estimated completion")
+    estimated_completion: Optional[UTCDatetime] = Field(None, description="Estimated completion")
 
 
 class JobListResponse(BaseModel):
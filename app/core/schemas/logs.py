@@ -1,9 +1,9 @@
 # Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
 # DevFlowFix - Autonomous AI agent the detects, analyzes, and resolves CI/CD failures in real-time.
 
-from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
+from app.core.schemas.common import UTCDatetime
 
 
 class ApplicationLogResponse(BaseModel):
@@ -22,7 +22,7 @@ class ApplicationLogResponse(BaseModel):
     llm_model: Optional[str] = None
     llm_tokens_used: Optional[int] = None
     llm_response_time_ms: Optional[int] = None
-    created_at: datetime
+    created_at: UTCDatetime
     duration_ms: Optional[int] = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -62,7 +62,7 @@ class LogFilterRequest(BaseModel):
     level: Optional[str] = None
     category: Optional[str] = None
     stage: Optional[str] = None
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
+    start_date: Optional[UTCDatetime] = None
+    end_date: Optional[UTCDatetime] = None
     skip: int = Field(default=0, ge=0)
     limit: int = Field(default=100, ge=1, le=1000)
@@ -8,8 +8,8 @@ Pydantic models for automated PR creation and management.
 """
 
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 from pydantic import BaseModel, Field
+from app.core.schemas.common import UTCDatetime
 
 
 class CreatePRRequest(BaseModel):
@@ -68,7 +68,7 @@ class CreatePRResponse(BaseModel):
     incident_id: str = Field(..., description="Associated incident ID")
     ai_analysis_used: bool = Field(..., description="Whether AI analysis was used")
     error_message: Optional[str] = Field(None, description="Error message if failed")
-    created_at: datetime = Field(..., description="PR creation timestamp")
+    created_at: UTCDatetime = Field(..., description="PR creation timestamp")
 
 
 class PRStatus(BaseModel):
@@ -82,8 +82,8 @@ class PRStatus(BaseModel):
     draft: bool = Field(..., description="Whether PR is draft")
     mergeable: Optional[bool] = Field(None, description="Whether PR is mergeable")
     merged: bool = Field(..., description="Whether PR was merged")
-    merged_at: Optional[datetime] = Field(None, description="Merge timestamp")
-    closed_at: Optional[datetime] = Field(None, description="Close timestamp")
+    merged_at: Optional[UTCDatetime] = Field(None, description="Merge timestamp")
+    closed_at: Optional[UTCDatetime] = Field(None, description="Close timestamp")
     branch_name: str = Field(..., description="Source branch name")
     base_branch: str = Field(..., description="Target branch name")
     commits: int = Field(..., description="Number of commits")
@@ -92,8 +92,8 @@ class PRStatus(BaseModel):
     deletions: int = Field(..., description="Lines deleted")
     comments: int = Field(..., description="Number of comments")
     reviews: int = Field(..., description="Number of reviews")
-    created_at: datetime = Field(..., description="PR creation time")
-    updated_at: datetime = Field(..., description="Last update time")
+    created_at: UTCDatetime = Field(..., description="PR creation time")
+    updated_at: UTCDatetime = Field(..., description="Last update time")
     created_by: str = Field(..., description="PR creator username")
 
 
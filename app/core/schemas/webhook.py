@@ -3,7 +3,7 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.core.enums import IncidentSource
 
@@ -28,6 +28,86 @@ class GitHubWebhookPayload(BaseModel):
     repository: dict = Field(..., description="Repository information")
     sender: Optional[dict] = Field(None, description="User who triggered the event")
 
+class GitHubRepositoryRef(BaseModel):
+    """ Repository block of a GitHub webhook event """
+    model_config = ConfigDict(extra="ignore")
+
+    full_name: str = Field(..., min_length=1, description="Repository full name (owner/repo)")
+
+class GitHubWebhookEnvelope(BaseModel):
+    """ Fields every GitHub webhook event must carry before it is routed """
+    model_config = ConfigDict(extra="ignore")
+
+    repository: GitHubRepositoryRef = Field(..., description="Repository the event belongs to")
+
+class GitLabProjectRef(BaseModel):
+    """ Project block of a GitLab webhook event """
+    model_config = ConfigDict(extra="ignore")
+
+    path_with_namespace: str = Field(..., min_length=1, description="Project path (group/project)")
+
+class GitLabWebhookEnvelope(BaseModel):
+    """ Fields every GitLab webhook event must carry before it is routed """
+    model_config = ConfigDict(extra="ignore")
+
+    project: GitLabProjectRef = Field(..., description="Project the event belongs to")
+
+class GitHubCommitAuthor(BaseModel):
+    """ Author block of a GitHub head commit """
+    model_config = ConfigDict(extra="ignore")
+
+    name: str = Field("", description="Commit author name")
+
+    @field_validator("name", mode="before")
+    @classmethod
+    def _null_name(cls, value):
+        return value or ""
+
+class GitHubHeadCommit(BaseModel):
+    """ Head commit of a GitHub workflow run """
+    model_config = ConfigDict(extra="ignore")
+
+    message: str = Field("", description="Commit message")
+    author: GitHubCommitAuthor = Field(default_factory=GitHubCommitAuthor, description="Commit author")
+
+    @field_validator("message", "author", mode="before")
+    @classmethod
+    def _null_fields(cls, value, info):
+        if value is None:
+            return "" if info.field_name == "message" else {}
+        return value
+
+class GitHubWorkflowRun(BaseModel):
+    """ Subset of the GitHub workflow_run object read by the webhook processor """
+    model_config = ConfigDict(extra="ignore")
+
+    id: int = Field(..., description="Workflow run ID")
+    run_number: int = Field(..., description="Workflow run number")
+    name: Optional[str] = Field(..., description="Workflow name")
+    workflow_id: int = Field(..., description="Workflow ID")
+    event: Optional[str] = Field(None, description="Event that triggered the run")
+    status: Optional[str] = Field(..., description="Run status")
+    conclusion: Optional[str] = Field(None, description="Run conclusion")
+    head_branch: Optional[str] = Field(..., description="Head branch")
+    head_sha: Optional[str] = Field(..., description="Head commit SHA")
+    head_commit: GitHubHeadCommit = Field(default_factory=GitHubHeadCommit, description="Head commit")
+    run_started_at: Optional[datetime] = Field(None, description="Run start time")
+    html_url: Optional[str] = Field(..., description="Run URL")
+    logs_url: Optional[str] = Field(None, description="Logs download URL")
+    path: Optional[str] = Field(None, description="Workflow file path")
+
+    @field_validator("head_commit", mode="before")
+    @classmethod
+    def _null_head_commit(cls, value):
+        return {} if value is None else value
+
+class GitHubWorkflowRunEvent(BaseModel):
+    """ GitHub workflow_run webhook event """
+    model_config = ConfigDict(extra="ignore")
+
+    action: Optional[str] = Field(None, description="Workflow run action")
+    workflow_run: GitHubWorkflowRun = Field(..., description="Workflow run details")
+
 class ArgoCDWebhookPayload(BaseModel):
     """ ArgoCD webhook specific payload """
     application: str = Field(..., description="Application name")
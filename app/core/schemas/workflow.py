@@ -36,13 +36,29 @@ class WorkflowRunResponse(BaseModel):
     created_at: datetime = Field(..., description="Tracking record creation time")
     updated_at: datetime = Field(..., description="Tracking record update time")
 
+class WorkflowRunSummaryResponse(BaseModel):
+    """Workflow run summary for list views; fetch a run by ID for full details."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str = Field(..., description="Workflow run tracking ID")
+    repository_connection_id: str = Field(..., description="Repository connection ID")
+    run_number: int = Field(..., description="Run number")
+    workflow_name: str = Field(..., description="Workflow name")
+    status: str = Field(..., description="Run status (queued, in_progress, completed)")
+    conclusion: Optional[str] = Field(None, description="Run conclusion (success, failure, cancelled, etc.)")
+    branch: str = Field(..., description="Branch name")
+    created_at: datetime = Field(..., description="Tracking record creation time")
+
+
 class WorkflowRunListResponse(BaseModel):
     """List of workflow runs."""
 
-    runs: List[WorkflowRunResponse] = Field(..., description="List of workflow runs")
-    total: int = Field(..., description="Total number of runs")
-    failed_runs: int = Field(default=0, description="Number of failed runs")
-    successful_runs: int = Field(default=0, description="Number of successful runs")
+    runs: List[WorkflowRunSummaryResponse] = Field(..., description="List of workflow run summaries")
+    total: int = Field(..., description="Total number of runs matching the filters")
+    failed_runs: int = Field(default=0, description="Number of failed runs matching the filters")
+    successful_runs: int = Field(default=0, description="Number of successful runs matching the filters")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page of runs")
 
 
 class WorkflowRunStatsResponse(BaseModel):
@@ -158,3 +174,35 @@ class WorkflowRetryRequest(BaseModel):
         default=False,
         description="Retry only failed jobs instead of entire workflow"
     )
+
+
+class WorkflowBulkRetryRequest(BaseModel):
+    """Request to retry several workflow runs at once."""
+
+    run_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Workflow run tracking IDs to retry"
+    )
+    retry_failed_jobs: bool = Field(
+        default=False,
+        description="Retry only failed jobs instead of entire workflows"
+    )
+
+
+class WorkflowRetryResult(BaseModel):
+    """Outcome of retrying a single workflow run."""
+
+    run_id: str = Field(..., description="Workflow run tracking ID")
+    github_run_id: Optional[str] = Field(None, description="GitHub workflow run ID")
+    success: bool = Field(..., description="Whether the rerun was triggered")
+    message: str = Field(..., description="Result message")
+
+
+class WorkflowBulkRetryResponse(BaseModel):
+    """Results of a bulk workflow retry."""
+
+    results: List[WorkflowRetryResult] = Field(..., description="Per-run results, in request order")
+    triggered: int = Field(..., description="Number of reruns triggered")
+    failed: int = Field(..., description="Number of runs that could not be rerun")
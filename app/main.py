@@ -1,6 +1,7 @@
 # Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
 # DevFlowFix - Autonomous AI agent the detects, analyzes, and resolves CI/CD failures in real-time.
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from fastapi import FastAPI, Request, Response, status, Header, Depends
@@ -68,8 +69,28 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("database_not_configured_starting_in_stateless_mode")
 
+    write_behind_flusher = None
+    if settings.database_configured:
+        from app.adapters.database.postgres.write_behind import run_write_behind_flusher
+        from app.auth.zitadel import login_buffer
+        from app.services.webhook.delivery_tracker import webhook_delivery_buffer
+        write_behind_flusher = asyncio.create_task(
+            run_write_behind_flusher([webhook_delivery_buffer, login_buffer])
+        )
+
+    # Warm the Zitadel connection pool so the first login skips the handshakes
+    from app.auth.zitadel import warm_http_client
+    await warm_http_client()
+
     yield
 
+    if write_behind_flusher is not None:
+        write_behind_flusher.cancel()
+        try:
+            await write_behind_flusher
+        except asyncio.CancelledError:
+            pass
+
     # Cleanup: Close persistent HTTP client
     from app.auth.zitadel import close_http_client
     await close_http_client()
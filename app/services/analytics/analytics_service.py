@@ -187,19 +187,19 @@ class AnalyticsService:
             successful = len([r for r in period_runs if r.conclusion == "success"])
             failed = len([r for r in period_runs if r.conclusion == "failure"])
 
-            total_runs.append(TimeSeriesDataPoint(
+            total_runs.append(TimeSeriesDataPoint.model_construct(
                 timestamp=period_start,
                 value=float(total),
             ))
-            successful_runs.append(TimeSeriesDataPoint(
+            successful_runs.append(TimeSeriesDataPoint.model_construct(
                 timestamp=period_start,
                 value=float(successful),
             ))
-            failed_runs.append(TimeSeriesDataPoint(
+            failed_runs.append(TimeSeriesDataPoint.model_construct(
                 timestamp=period_start,
                 value=float(failed),
             ))
-            failure_rate.append(TimeSeriesDataPoint(
+            failure_rate.append(TimeSeriesDataPoint.model_construct(
                 timestamp=period_start,
                 value=(failed / total * 100) if total > 0 else 0.0,
             ))
@@ -210,7 +210,7 @@ class AnalyticsService:
                 for r in period_runs
                 if r.started_at and r.completed_at
             ]
-            avg_duration.append(TimeSeriesDataPoint(
+            avg_duration.append(TimeSeriesDataPoint.model_construct(
                 timestamp=period_start,
                 value=sum(durations) / len(durations) if durations else 0.0,
             ))
@@ -397,15 +397,15 @@ class AnalyticsService:
 
             cumulative_open += (created - resolved)
 
-            incidents_created.append(TimeSeriesDataPoint(
+            incidents_created.append(TimeSeriesDataPoint.model_construct(
                 timestamp=period_start,
                 value=float(created),
             ))
-            incidents_resolved.append(TimeSeriesDataPoint(
+            incidents_resolved.append(TimeSeriesDataPoint.model_construct(
                 timestamp=period_start,
                 value=float(resolved),
             ))
-            open_incidents_series.append(TimeSeriesDataPoint(
+            open_incidents_series.append(TimeSeriesDataPoint.model_construct(
                 timestamp=period_start,
                 value=float(max(0, cumulative_open)),
             ))
@@ -415,7 +415,7 @@ class AnalyticsService:
         for severity in ["critical", "high", "medium", "low"]:
             severity_incidents = [i for i in incidents if i.severity == severity]
             by_severity[severity] = [
-                TimeSeriesDataPoint(
+                TimeSeriesDataPoint.model_construct(
                     timestamp=period_start,
                     value=float(len([i for i in period_incidents if i.severity == severity])),
                 )
@@ -588,19 +588,18 @@ class AnalyticsService:
 
         # Create buckets
         buckets = {}
+        bucket_lists = []
         current = start_date
         while current <= end_date:
             buckets[current] = []
+            bucket_lists.append(buckets[current])
             current += delta
 
-        # Assign items to buckets
+        # Assign items to buckets. Buckets are evenly spaced, so the index
+        # is plain arithmetic instead of a scan over every bucket.
         for item in items:
-            item_date = item.created_at
-            # Find appropriate bucket
-            for bucket_start in sorted(buckets.keys()):
-                bucket_end = bucket_start + delta
-                if bucket_start <= item_date < bucket_end:
-                    buckets[bucket_start].append(item)
-                    break
+            index = (item.created_at - start_date) // delta
+            if 0 <= index < len(bucket_lists):
+                bucket_lists[index].append(item)
 
         return buckets
@@ -273,7 +273,7 @@ class ConfidenceScorer:
             if resolved_at:
                 if isinstance(resolved_at, str):
                     try:
-                        resolved_at = datetime.fromisoformat(resolved_at.replace('Z', '+00:00'))
+                        resolved_at = datetime.fromisoformat(resolved_at)
                     except (ValueError, AttributeError):
                         continue
                 
@@ -7,13 +7,20 @@ OAuth Token Manager
 Handles secure storage, encryption, and refresh of OAuth tokens.
 """
 
+import threading
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone
+from cachetools import TTLCache
 from cryptography.fernet import Fernet
+from sqlalchemy import lambda_stmt, select
 import structlog
 
+from app.adapters.database.postgres.models import OAuthConnectionTable
+
 logger = structlog.get_logger(__name__)
 
+DECRYPTED_TOKEN_CACHE_TTL_SECONDS = 60
+
 
 class TokenManager:
     """
@@ -42,6 +49,14 @@ class TokenManager:
                 message="OAuth tokens will be stored in plaintext! Set OAUTH_TOKEN_ENCRYPTION_KEY in production.",
             )
 
+        # Decrypted access tokens keyed by their ciphertext, so bursts of calls
+        # for the same connection decrypt once and a rotated token always misses
+        self._decrypted_tokens: TTLCache = TTLCache(
+            maxsize=1024,
+            ttl=DECRYPTED_TOKEN_CACHE_TTL_SECONDS,
+        )
+        self._decrypted_tokens_lock = threading.Lock()
+
     def encrypt_token(self, token: str) -> str:
         """
         Encrypt an OAuth token for storage.
@@ -120,7 +135,6 @@ class TokenManager:
         Returns:
             OAuthConnectionTable record
         """
-        from app.adapters.database.postgres.models import OAuthConnectionTable
         from uuid import uuid4
 
         # Encrypt tokens
@@ -199,17 +213,18 @@ class TokenManager:
         Returns:
             OAuthConnectionTable record or None
         """
-        from app.adapters.database.postgres.models import OAuthConnectionTable
 
-        connection = (
-            db.query(OAuthConnectionTable)
-            .filter(
-                OAuthConnectionTable.user_id == user_id,
-                OAuthConnectionTable.provider == provider,
-                OAuthConnectionTable.is_active == True,
+        # Lambda statement: SQLAlchemy caches the construct and its compiled
+        # SQL, so each call only binds user_id and provider
+        connection = db.execute(
+            lambda_stmt(
+                lambda: select(OAuthConnectionTable).where(
+                    OAuthConnectionTable.user_id == user_id,
+                    OAuthConnectionTable.provider == provider,
+                    OAuthConnectionTable.is_active == True,
+                )
             )
-            .first()
-        )
+        ).scalars().first()
 
         if connection:
             # Update last_used_at
@@ -228,7 +243,17 @@ class TokenManager:
         Returns:
             Decrypted access token
         """
-        return self.decrypt_token(oauth_connection.access_token)
+        encrypted_token = oauth_connection.access_token
+        if not self.encryption_enabled:
+            return encrypted_token
+
+        with self._decrypted_tokens_lock:
+            token = self._decrypted_tokens.get(encrypted_token)
+        if token is None:
+            token = self.decrypt_token(encrypted_token)
+            with self._decrypted_tokens_lock:
+                self._decrypted_tokens[encrypted_token] = token
+        return token
 
     async def revoke_oauth_connection(
         self, db, connection_id: str, user_id: str
@@ -244,7 +269,6 @@ class TokenManager:
         Returns:
             True if successful
         """
-        from app.adapters.database.postgres.models import OAuthConnectionTable
 
         connection = (
             db.query(OAuthConnectionTable)
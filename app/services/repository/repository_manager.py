@@ -20,6 +20,7 @@ from app.adapters.database.postgres.models import (
 )
 from app.services.oauth.github_oauth import GitHubOAuthProvider
 from app.services.oauth.token_manager import TokenManager
+from app.services.webhook.repository_lookup import invalidate_repository_connection
 
 logger = structlog.get_logger(__name__)
 
@@ -366,6 +367,7 @@ class RepositoryManager:
         connection.updated_at = datetime.now(timezone.utc)
 
         db.flush()
+        invalidate_repository_connection(connection.provider, connection.repository_full_name)
 
         logger.info(
             "repository_disconnected",
@@ -433,6 +435,7 @@ class RepositoryManager:
         connection.updated_at = datetime.now(timezone.utc)
 
         db.flush()
+        invalidate_repository_connection(connection.provider, connection.repository_full_name)
 
         logger.info(
             "repository_connection_updated",
@@ -7,6 +7,21 @@ Webhook Services
 Handles webhook management and processing for GitHub/GitLab repositories.
 """
 
+from .delivery_tracker import flush_webhook_deliveries, record_webhook_delivery
+from .repository_lookup import (
+    RepositoryConnectionSnapshot,
+    get_cached_repository_connection,
+    get_repository_connection_snapshot,
+    invalidate_repository_connection,
+)
 from .webhook_manager import WebhookManager
 
-__all__ = ["WebhookManager"]
+__all__ = [
+    "RepositoryConnectionSnapshot",
+    "WebhookManager",
+    "flush_webhook_deliveries",
+    "get_cached_repository_connection",
+    "get_repository_connection_snapshot",
+    "invalidate_repository_connection",
+    "record_webhook_delivery",
+]
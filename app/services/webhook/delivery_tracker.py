@@ -0,0 +1,22 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+"""
+Webhook Delivery Tracker
+
+Buffers ``webhook_last_delivery_at`` bumps and writes them behind the
+request path in one bulk UPDATE per flush interval.
+"""
+
+from app.adapters.database.postgres.models import RepositoryConnectionTable
+from app.adapters.database.postgres.write_behind import TimestampWriteBuffer
+
+webhook_delivery_buffer = TimestampWriteBuffer(
+    RepositoryConnectionTable, "id", "webhook_last_delivery_at"
+)
+
+# Buffer the latest delivery time for a repository connection
+record_webhook_delivery = webhook_delivery_buffer.record
+
+# Write all buffered delivery times in a single bulk UPDATE
+flush_webhook_deliveries = webhook_delivery_buffer.flush
@@ -0,0 +1,121 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+"""
+Repository Connection Lookup
+
+Process-local TTL cache for the repository connection lookup performed on
+every incoming webhook delivery.
+"""
+
+import threading
+from typing import NamedTuple, Optional
+
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+import structlog
+
+from app.adapters.database.postgres.models import RepositoryConnectionTable
+
+logger = structlog.get_logger(__name__)
+
+REPOSITORY_CONNECTION_CACHE_TTL_SECONDS = 60
+
+
+class RepositoryConnectionSnapshot(NamedTuple):
+    """Detached, read-only view of the repository connection fields webhooks use."""
+
+    id: str
+    user_id: str
+    provider: str
+    repository_full_name: str
+    webhook_secret: Optional[str]
+    is_enabled: bool
+    auto_pr_enabled: bool
+
+
+# Same order as the snapshot fields, so a result row maps straight onto it.
+_SNAPSHOT_COLUMNS = tuple(
+    getattr(RepositoryConnectionTable, field) for field in RepositoryConnectionSnapshot._fields
+)
+
+_repo_conn_cache: TTLCache = TTLCache(
+    maxsize=10_000,
+    ttl=REPOSITORY_CONNECTION_CACHE_TTL_SECONDS,
+)
+_repo_conn_cache_lock = threading.Lock()
+
+
+def get_cached_repository_connection(
+    provider: str,
+    repository_full_name: str,
+) -> Optional[RepositoryConnectionSnapshot]:
+    """
+    Return a cached repository connection without touching the database.
+
+    Args:
+        provider: Provider name (github, gitlab)
+        repository_full_name: Repository full name (owner/repo or group/project)
+
+    Returns:
+        RepositoryConnectionSnapshot or None if not cached
+    """
+    with _repo_conn_cache_lock:
+        return _repo_conn_cache.get((provider, repository_full_name))
+
+
+def get_repository_connection_snapshot(
+    db: Session,
+    provider: str,
+    repository_full_name: str,
+) -> Optional[RepositoryConnectionSnapshot]:
+    """
+    Look up a repository connection by provider and full name.
+
+    Hits are served from the cache without touching the database. Misses
+    are not cached, so a newly connected repository is visible immediately.
+
+    Args:
+        db: Database session
+        provider: Provider name (github, gitlab)
+        repository_full_name: Repository full name (owner/repo or group/project)
+
+    Returns:
+        RepositoryConnectionSnapshot or None if the repository is not connected
+    """
+    snapshot = get_cached_repository_connection(provider, repository_full_name)
+    if snapshot is not None:
+        return snapshot
+
+    row = db.execute(
+        select(*_SNAPSHOT_COLUMNS).where(
+            RepositoryConnectionTable.repository_full_name == repository_full_name,
+            RepositoryConnectionTable.provider == provider,
+        )
+    ).first()
+    if row is None:
+        return None
+
+    snapshot = RepositoryConnectionSnapshot(*row)
+    with _repo_conn_cache_lock:
+        _repo_conn_cache[(provider, repository_full_name)] = snapshot
+    return snapshot
+
+
+def invalidate_repository_connection(provider: str, repository_full_name: str) -> None:
+    """
+    Drop a cached repository connection after it is modified.
+
+    Args:
+        provider: Provider name (github, gitlab)
+        repository_full_name: Repository full name
+    """
+    with _repo_conn_cache_lock:
+        removed = _repo_conn_cache.pop((provider, repository_full_name), None)
+    if removed is not None:
+        logger.debug(
+            "repository_connection_cache_invalidated",
+            provider=provider,
+            repository=repository_full_name,
+        )
@@ -9,7 +9,6 @@ Handles automatic webhook creation, deletion, and management for GitHub/GitLab r
 
 import secrets
 import hmac
-import hashlib
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
@@ -20,6 +19,7 @@ from app.services.oauth.gitlab_oauth import GitLabOAuthProvider
 from app.services.oauth.token_manager import TokenManager
 from app.adapters.database.postgres.models import RepositoryConnectionTable, OAuthConnectionTable
 from app.core.config import Settings
+from app.services.webhook.repository_lookup import invalidate_repository_connection
 
 logger = structlog.get_logger(__name__)
 
@@ -190,6 +190,7 @@ class WebhookManager:
         repo_conn.webhook_created_at = datetime.now(timezone.utc)
 
         db.commit()
+        invalidate_repository_connection(repo_conn.provider, repo_conn.repository_full_name)
 
         logger.info(
             "webhook_created",
@@ -348,6 +349,7 @@ class WebhookManager:
             repo_conn.webhook_secret = None
             repo_conn.webhook_status = "inactive"
             db.commit()
+            invalidate_repository_connection(repo_conn.provider, repo_conn.repository_full_name)
             return True
 
         # Get access token
@@ -390,6 +392,7 @@ class WebhookManager:
         repo_conn.webhook_status = "inactive"
 
         db.commit()
+        invalidate_repository_connection(repo_conn.provider, repo_conn.repository_full_name)
 
         logger.info(
             "webhook_deleted",
@@ -495,13 +498,14 @@ class WebhookManager:
         if not signature.startswith("sha256="):
             raise ValueError("Invalid signature format")
 
-        expected_signature = "sha256=" + hmac.new(
-            key=secret.encode(),
-            msg=payload,
-            digestmod=hashlib.sha256
-        ).hexdigest()
+        try:
+            received_digest = bytes.fromhex(signature[7:])
+        except ValueError:
+            return False
+
+        expected_digest = hmac.digest(secret.encode(), payload, "sha256")
 
-        return hmac.compare_digest(expected_signature, signature)
+        return hmac.compare_digest(expected_digest, received_digest)
 
     @staticmethod
     def verify_gitlab_signature(
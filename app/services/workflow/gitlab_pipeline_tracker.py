@@ -124,17 +124,17 @@ class GitLabPipelineTracker:
 
             # Parse timestamps
             created_at = (
-                datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
+                datetime.fromisoformat(created_at_str)
                 if created_at_str
                 else datetime.now(timezone.utc)
             )
             updated_at = (
-                datetime.fromisoformat(updated_at_str.replace("Z", "+00:00"))
+                datetime.fromisoformat(updated_at_str)
                 if updated_at_str
                 else None
             )
             finished_at = (
-                datetime.fromisoformat(finished_at_str.replace("Z", "+00:00"))
+                datetime.fromisoformat(finished_at_str)
                 if finished_at_str
                 else None
             )
@@ -12,7 +12,7 @@ import httpx
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, desc, func, select
 import structlog
 
 from app.adapters.database.postgres.models import (
@@ -46,7 +46,8 @@ class WorkflowTracker:
         """
         self.token_manager = token_manager
 
-    def generate_workflow_run_id(self) -> str:
+    @staticmethod
+    def generate_workflow_run_id() -> str:
         """
         Generate unique workflow run tracking ID.
 
@@ -112,14 +113,10 @@ class WorkflowTracker:
             existing_run.updated_at = datetime.now(timezone.utc)
 
             if workflow_run.get("run_started_at"):
-                existing_run.started_at = datetime.fromisoformat(
-                    workflow_run["run_started_at"].replace("Z", "+00:00")
-                )
+                existing_run.started_at = datetime.fromisoformat(workflow_run["run_started_at"])
 
             if workflow_run.get("updated_at"):
-                existing_run.completed_at = datetime.fromisoformat(
-                    workflow_run["updated_at"].replace("Z", "+00:00")
-                )
+                existing_run.completed_at = datetime.fromisoformat(workflow_run["updated_at"])
 
             db.flush()
 
@@ -157,12 +154,12 @@ class WorkflowTracker:
                 commit_message=head_commit.get("message"),
                 author=head_commit.get("author", {}).get("name"),
                 started_at=(
-                    datetime.fromisoformat(workflow_run["run_started_at"].replace("Z", "+00:00"))
+                    datetime.fromisoformat(workflow_run["run_started_at"])
                     if workflow_run.get("run_started_at")
                     else None
                 ),
                 completed_at=(
-                    datetime.fromisoformat(workflow_run["updated_at"].replace("Z", "+00:00"))
+                    datetime.fromisoformat(workflow_run["updated_at"])
                     if workflow_run.get("updated_at") and status == "completed"
                     else None
                 ),
@@ -488,57 +485,60 @@ class WorkflowTracker:
         Returns:
             Dictionary with statistics
         """
+        # Count tracked repositories
+        tracked_repos = (
+            select(func.count(RepositoryConnectionTable.id))
+            .where(
+                and_(
+                    RepositoryConnectionTable.user_id == user_id,
+                    RepositoryConnectionTable.is_enabled == True,
+                )
+            )
+            .scalar_subquery()
+        )
+
+        # Every statistic in one aggregate round-trip; AVG skips runs missing
+        # either timestamp because their difference is NULL
         query = (
-            db.query(WorkflowRunTable)
+            select(
+                func.count(WorkflowRunTable.id),
+                func.count(WorkflowRunTable.id).filter(WorkflowRunTable.conclusion == "failure"),
+                func.count(WorkflowRunTable.id).filter(WorkflowRunTable.conclusion == "success"),
+                func.count(WorkflowRunTable.id).filter(WorkflowRunTable.status == "in_progress"),
+                func.count(WorkflowRunTable.id).filter(WorkflowRunTable.status == "completed"),
+                func.avg(
+                    func.extract("epoch", WorkflowRunTable.completed_at - WorkflowRunTable.started_at)
+                ),
+                tracked_repos,
+            )
             .join(
                 RepositoryConnectionTable,
                 WorkflowRunTable.repository_connection_id == RepositoryConnectionTable.id,
             )
-            .filter(RepositoryConnectionTable.user_id == user_id)
+            .where(RepositoryConnectionTable.user_id == user_id)
         )
 
         if repository_connection_id:
-            query = query.filter(
+            query = query.where(
                 WorkflowRunTable.repository_connection_id == repository_connection_id
             )
 
-        all_runs = query.all()
+        (
+            total_runs,
+            failed_runs,
+            successful_runs,
+            in_progress_runs,
+            completed_runs,
+            avg_duration,
+            tracked_repos,
+        ) = db.execute(query).one()
 
-        total_runs = len(all_runs)
-        failed_runs = len([r for r in all_runs if r.conclusion == "failure"])
-        successful_runs = len([r for r in all_runs if r.conclusion == "success"])
-        in_progress_runs = len([r for r in all_runs if r.status == "in_progress"])
-
-        # Calculate average duration
-        completed_runs_with_duration = [
-            r for r in all_runs
-            if r.started_at and r.completed_at
-        ]
-
-        avg_duration = None
-        if completed_runs_with_duration:
-            total_duration = sum(
-                (r.completed_at - r.started_at).total_seconds()
-                for r in completed_runs_with_duration
-            )
-            avg_duration = total_duration / len(completed_runs_with_duration)
+        if avg_duration is not None:
+            avg_duration = float(avg_duration)
 
         # Calculate failure rate
-        completed_runs = len([r for r in all_runs if r.status == "completed"])
         failure_rate = (failed_runs / completed_runs * 100) if completed_runs > 0 else 0.0
 
-        # Count tracked repositories
-        tracked_repos = (
-            db.query(RepositoryConnectionTable.id)
-            .filter(
-                and_(
-                    RepositoryConnectionTable.user_id == user_id,
-                    RepositoryConnectionTable.is_enabled == True,
-                )
-            )
-            .count()
-        )
-
         return {
             "total_runs": total_runs,
             "failed_runs": failed_runs,
@@ -0,0 +1,55 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+"""
+Unit tests for the write-behind timestamp buffer.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from app.adapters.database.postgres.models import UserTable
+from app.adapters.database.postgres.write_behind import TimestampWriteBuffer
+
+
+class TestTimestampWriteBuffer:
+    """Test suite for buffered timestamp writes."""
+
+    @pytest.fixture
+    def buffer(self):
+        """Create an empty buffer."""
+        return TimestampWriteBuffer(UserTable, "user_id", "last_login_at")
+
+    def test_record_keeps_latest_timestamp(self, buffer):
+        """Test that repeated bumps coalesce to the newest time."""
+        now = datetime.now(timezone.utc)
+        buffer.record("user_123", now)
+        buffer.record("user_123", now - timedelta(seconds=5))
+
+        assert buffer._drain() == {"user_123": now}
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_pending_once(self, buffer, monkeypatch):
+        """Test that a flush writes all buffered rows in one call."""
+        writes = []
+        monkeypatch.setattr(buffer, "_write", writes.append)
+        now = datetime.now(timezone.utc)
+        buffer.record("user_1", now)
+        buffer.record("user_2", now)
+
+        assert await buffer.flush() == 2
+        assert await buffer.flush() == 0
+        assert writes == [{"user_1": now, "user_2": now}]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues(self, buffer, monkeypatch):
+        """Test that timestamps survive a failed write for the next flush."""
+        def fail(pending):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(buffer, "_write", fail)
+        now = datetime.now(timezone.utc)
+        buffer.record("user_123", now)
+
+        assert await buffer.flush() == 0
+        assert buffer._drain() == {"user_123": now}
@@ -1,7 +1,17 @@
 # Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
 # DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
 
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
 from app.api.v1.webhook_payloads import extract_github_payload
+from app.core.schemas.webhook import (
+    GitHubWebhookEnvelope,
+    GitHubWorkflowRunEvent,
+    GitLabWebhookEnvelope,
+)
 
 
 def test_extract_github_payload_workflow_run_includes_required_context() -> None:
@@ -77,3 +87,74 @@ def test_extract_github_payload_check_run_includes_repo_branch_and_run_context()
     assert context["event_type"] == "check_run"
     assert context["details_url"] == "https://api.github.com/repos/owner/repo/check-runs/321"
     assert context["changed_files"] == ["src/app.py"]
+
+
+def test_workflow_run_event_parses_nested_fields_and_timestamp() -> None:
+    payload = {
+        "action": "completed",
+        "workflow_run": {
+            "id": 123,
+            "run_number": 9,
+            "name": "CI",
+            "workflow_id": 456,
+            "status": "completed",
+            "conclusion": "failure",
+            "head_branch": "main",
+            "head_sha": "abc123def456",
+            "html_url": "https://github.com/owner/repo/actions/runs/123",
+            "run_started_at": "2025-01-02T10:00:00Z",
+            "head_commit": {"message": "Fix build", "author": {"name": "Tabish"}},
+        },
+        "repository": {"full_name": "owner/repo"},
+    }
+
+    run = GitHubWorkflowRunEvent.model_validate(payload).workflow_run
+
+    assert run.head_commit.message == "Fix build"
+    assert run.head_commit.author.name == "Tabish"
+    assert run.run_started_at == datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)
+
+
+def test_workflow_run_event_tolerates_null_head_commit() -> None:
+    payload = {
+        "action": "completed",
+        "workflow_run": {
+            "id": 123,
+            "run_number": 9,
+            "name": "CI",
+            "workflow_id": 456,
+            "status": "completed",
+            "head_branch": "main",
+            "head_sha": "abc123def456",
+            "html_url": "https://github.com/owner/repo/actions/runs/123",
+            "head_commit": None,
+        },
+    }
+
+    run = GitHubWorkflowRunEvent.model_validate(payload).workflow_run
+
+    assert run.head_commit.message == ""
+    assert run.head_commit.author.name == ""
+    assert run.run_started_at is None
+
+
+def test_workflow_run_event_rejects_missing_required_fields() -> None:
+    with pytest.raises(ValidationError):
+        GitHubWorkflowRunEvent.model_validate({"action": "completed", "workflow_run": {"id": 1}})
+
+
+def test_webhook_envelopes_extract_repository_identity() -> None:
+    github = GitHubWebhookEnvelope.model_validate({"repository": {"full_name": "owner/repo", "id": 1}})
+    gitlab = GitLabWebhookEnvelope.model_validate({"project": {"path_with_namespace": "group/project"}})
+
+    assert github.repository.full_name == "owner/repo"
+    assert gitlab.project.path_with_namespace == "group/project"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [{}, {"repository": None}, {"repository": {"full_name": ""}}, ["not", "an", "object"]],
+)
+def test_github_webhook_envelope_rejects_missing_repository(payload) -> None:
+    with pytest.raises(ValidationError):
+        GitHubWebhookEnvelope.model_validate(payload)
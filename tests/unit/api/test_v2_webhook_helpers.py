@@ -0,0 +1,216 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+import pytest
+from fastapi import BackgroundTasks
+
+from app.api.v2 import webhooks
+
+
+class FakeRedisCache:
+    def __init__(self, result=True):
+        self.result = result
+        self.keys = set()
+        self.deleted = []
+
+    async def set_if_absent(self, key, value, ttl=None):
+        if self.result is None:
+            return None
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        return self.result
+
+    async def delete(self, key):
+        self.deleted.append(key)
+        self.keys.discard(key)
+        return True
+
+
+@pytest.fixture(autouse=True)
+def clear_recent_deliveries():
+    webhooks._recent_deliveries.clear()
+    yield
+    webhooks._recent_deliveries.clear()
+
+
+@pytest.mark.asyncio
+async def test_claim_delivery_rejects_repeat_in_process(monkeypatch):
+    cache = FakeRedisCache()
+    monkeypatch.setattr(webhooks, "get_redis_cache", lambda: cache)
+
+    assert await webhooks._claim_delivery("webhook:delivery:github:abc") is True
+    assert await webhooks._claim_delivery("webhook:delivery:github:abc") is False
+
+
+@pytest.mark.asyncio
+async def test_claim_delivery_rejects_delivery_claimed_by_another_worker(monkeypatch):
+    cache = FakeRedisCache(result=False)
+    monkeypatch.setattr(webhooks, "get_redis_cache", lambda: cache)
+
+    assert await webhooks._claim_delivery("webhook:delivery:github:abc") is False
+
+
+@pytest.mark.asyncio
+async def test_claim_delivery_fails_open_when_redis_errors(monkeypatch):
+    cache = FakeRedisCache(result=None)
+    monkeypatch.setattr(webhooks, "get_redis_cache", lambda: cache)
+
+    assert await webhooks._claim_delivery("webhook:delivery:github:abc") is True
+
+
+@pytest.mark.asyncio
+async def test_release_delivery_allows_retry(monkeypatch):
+    cache = FakeRedisCache()
+    monkeypatch.setattr(webhooks, "get_redis_cache", lambda: cache)
+
+    await webhooks._claim_delivery("webhook:delivery:github:abc")
+    await webhooks._release_delivery("webhook:delivery:github:abc")
+
+    assert cache.deleted == ["webhook:delivery:github:abc"]
+    assert await webhooks._claim_delivery("webhook:delivery:github:abc") is True
+
+
+def test_plaintext_secret_is_decrypted_once_per_ciphertext(monkeypatch):
+    webhooks._webhook_secret_cache.clear()
+    calls = []
+
+    class FakeTokenManager:
+        def decrypt_token(self, ciphertext):
+            calls.append(ciphertext)
+            return f"plain-{ciphertext}"
+
+    monkeypatch.setattr(webhooks, "token_manager", FakeTokenManager())
+
+    assert webhooks._get_plaintext_secret("cipher-a") == "plain-cipher-a"
+    assert webhooks._get_plaintext_secret("cipher-a") == "plain-cipher-a"
+    assert webhooks._get_plaintext_secret("cipher-b") == "plain-cipher-b"
+    assert calls == ["cipher-a", "cipher-b"]
+    webhooks._webhook_secret_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_unhandled_github_event_skips_body():
+    class FakeRequest:
+        headers = {"X-GitHub-Event": "star", "X-Hub-Signature-256": "sha256=abc"}
+
+        async def body(self):
+            raise AssertionError("body should not be read for unhandled events")
+
+    result = await webhooks.github_webhook(FakeRequest(), BackgroundTasks())
+
+    assert result == {"status": "ok", "message": "Event type star not processed"}
+
+
+class FakeSession:
+    def __init__(self):
+        self.committed = False
+        self.rolled_back = False
+        self.closed = False
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_background_github_event_commits_own_session(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(webhooks, "_open_session", lambda: session)
+
+    async def fake_processor(db, payload, repo_conn):
+        assert db is session
+        return {"status": "ok", "message": "processed"}
+
+    monkeypatch.setitem(webhooks._GITHUB_EVENT_PROCESSORS, "push", fake_processor)
+
+    repo_conn = webhooks.RepositoryConnectionSnapshot(
+        "rpc_123", "user_123", "github", "owner/repo", "encrypted", True, False
+    )
+    await webhooks._process_github_event("push", {}, repo_conn, None)
+
+    assert session.committed and session.closed
+    assert not session.rolled_back
+
+
+@pytest.mark.asyncio
+async def test_background_github_event_failure_releases_delivery(monkeypatch):
+    cache = FakeRedisCache()
+    session = FakeSession()
+    monkeypatch.setattr(webhooks, "get_redis_cache", lambda: cache)
+    monkeypatch.setattr(webhooks, "_open_session", lambda: session)
+
+    async def failing_processor(db, payload, repo_conn):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(webhooks._GITHUB_EVENT_PROCESSORS, "push", failing_processor)
+
+    repo_conn = webhooks.RepositoryConnectionSnapshot(
+        "rpc_123", "user_123", "github", "owner/repo", "encrypted", True, False
+    )
+    await webhooks._claim_delivery("webhook:delivery:github:abc")
+    await webhooks._process_github_event("push", {}, repo_conn, "webhook:delivery:github:abc")
+
+    assert session.rolled_back and session.closed
+    assert cache.deleted == ["webhook:delivery:github:abc"]
+
+
+@pytest.mark.asyncio
+async def test_known_github_delivery_skips_body():
+    class FakeRequest:
+        headers = {
+            "X-GitHub-Event": "push",
+            "X-Hub-Signature-256": "sha256=abc",
+            "X-GitHub-Delivery": "abc",
+        }
+
+        async def body(self):
+            raise AssertionError("body should not be read for a known delivery")
+
+    webhooks._recent_deliveries["webhook:delivery:github:abc"] = True
+
+    result = await webhooks.github_webhook(FakeRequest(), BackgroundTasks())
+
+    assert result == {"status": "ok", "message": "Duplicate delivery ignored"}
+
+
+def test_receipt_logs_are_sampled(monkeypatch):
+    monkeypatch.setattr(webhooks, "_receipt_log_counter", webhooks.itertools.count())
+
+    sampled = [webhooks._sample_receipt_log() for _ in range(webhooks.RECEIPT_LOG_SAMPLE_RATE * 3)]
+
+    assert sampled.count(True) == 3
+    assert sampled[0] is True
+
+
+@pytest.mark.asyncio
+async def test_unhandled_gitlab_event_skips_body():
+    class FakeRequest:
+        headers = {"X-Gitlab-Event": "Issue Hook", "X-Gitlab-Token": "token"}
+
+        async def body(self):
+            raise AssertionError("body should not be read for unhandled events")
+
+    result = await webhooks.gitlab_webhook(FakeRequest())
+
+    assert result == {"status": "ok", "message": "Event type Issue Hook not processed"}
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_lookup_opens_no_session(monkeypatch):
+    snapshot = webhooks.RepositoryConnectionSnapshot(
+        "rpc_123", "user_123", "github", "owner/repo", "encrypted", True, False
+    )
+    monkeypatch.setattr(webhooks, "get_cached_repository_connection", lambda provider, name: snapshot)
+
+    def fail_open_session():
+        raise AssertionError("cache hits should not open a session")
+
+    monkeypatch.setattr(webhooks, "_open_session", fail_open_session)
+
+    assert await webhooks._lookup_repository_connection("github", "owner/repo") is snapshot
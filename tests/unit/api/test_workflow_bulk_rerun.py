@@ -0,0 +1,66 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v2.workflows import rerun_workflows
+from app.core.schemas.workflow import WorkflowBulkRetryRequest
+
+
+def _tracker(rerun_results) -> SimpleNamespace:
+    token_manager = MagicMock()
+    token_manager.get_decrypted_token.return_value = "token"
+    return SimpleNamespace(
+        token_manager=token_manager,
+        rerun_workflow=AsyncMock(side_effect=rerun_results),
+    )
+
+
+def _db(rows) -> MagicMock:
+    db = MagicMock()
+    db.execute.return_value.all.return_value = rows
+    return db
+
+
+@pytest.mark.asyncio
+async def test_bulk_rerun_loads_runs_once_and_reports_each_run() -> None:
+    oauth_conn = SimpleNamespace(last_used_at=None)
+    db = _db([
+        ("wfr_1", "101", "owner/repo", oauth_conn),
+        ("wfr_2", "102", "owner/other", oauth_conn),
+    ])
+    tracker = _tracker([True, RuntimeError("boom")])
+
+    response = await rerun_workflows(
+        request=WorkflowBulkRetryRequest(run_ids=["wfr_1", "wfr_2", "wfr_missing", "wfr_1"]),
+        db=db,
+        current_user_data={"user": SimpleNamespace(user_id="user_1")},
+        tracker=tracker,
+    )
+
+    assert db.execute.call_count == 1
+    tracker.token_manager.get_decrypted_token.assert_called_once_with(oauth_conn)
+    assert oauth_conn.last_used_at is not None
+    assert [(r.run_id, r.success) for r in response.results] == [
+        ("wfr_1", True),
+        ("wfr_2", False),
+        ("wfr_missing", False),
+    ]
+    assert (response.triggered, response.failed) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_bulk_rerun_requires_github_connection() -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await rerun_workflows(
+            request=WorkflowBulkRetryRequest(run_ids=["wfr_1"]),
+            db=_db([("wfr_1", "101", "owner/repo", None)]),
+            current_user_data={"user": SimpleNamespace(user_id="user_1")},
+            tracker=_tracker([]),
+        )
+
+    assert exc_info.value.status_code == 400
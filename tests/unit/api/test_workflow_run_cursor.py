@@ -0,0 +1,24 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v2.workflows import _decode_run_cursor, _encode_run_cursor
+
+
+def test_run_cursor_round_trips_sort_key() -> None:
+    run = SimpleNamespace(created_at=datetime(2025, 3, 1, 12, 30, 5, 123456), id="wfr_abc|def")
+
+    assert _decode_run_cursor(_encode_run_cursor(run)) == (run.created_at, run.id)
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "bm8tc2VwYXJhdG9y", "eWVzdGVyZGF5fHdmcl8x"])
+def test_invalid_run_cursor_is_rejected(cursor) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_run_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
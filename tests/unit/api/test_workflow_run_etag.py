@@ -0,0 +1,37 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+from datetime import datetime
+
+import pytest
+from starlette.requests import Request
+
+from app.api.v2.workflows import _etag_matches, _runs_etag
+
+
+def _request(if_none_match=None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "headers": headers})
+
+
+def test_runs_etag_changes_with_fingerprint() -> None:
+    updated_at = datetime(2025, 3, 1, 12, 30)
+
+    assert _runs_etag("user_1", 3, updated_at) == _runs_etag("user_1", 3, updated_at)
+    assert _runs_etag("user_1", 3, updated_at) != _runs_etag("user_1", 4, updated_at)
+    assert _runs_etag("user_1", 3, updated_at) != _runs_etag("user_2", 3, updated_at)
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", "abc"', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_etag_matches_if_none_match(if_none_match, expected) -> None:
+    assert _etag_matches(_request(if_none_match), '"abc"') is expected
@@ -7,6 +7,7 @@ import pytest
 from app.auth.zitadel import (
     ZitadelAuth,
     ZitadelUser,
+    _token_cache_key,
     get_current_active_analytics_user,
 )
 
@@ -17,7 +18,7 @@ async def test_get_userinfo_deduplicates_concurrent_requests():
 
     calls = 0
 
-    async def fake_fetch(token: str):
+    async def fake_fetch(token: str, token_key: str):
         nonlocal calls
         calls += 1
         await asyncio.sleep(0.01)
@@ -35,6 +36,48 @@ async def test_get_userinfo_deduplicates_concurrent_requests():
     assert all(result["sub"] == "user_123" for result in results)
 
 
+@pytest.mark.asyncio
+async def test_get_userinfo_shares_redis_lookup_between_concurrent_requests(monkeypatch):
+    from app.auth import zitadel as zitadel_module
+
+    auth = ZitadelAuth(settings=SimpleNamespace(userinfo_uri="https://example.com/userinfo"))
+    reads = 0
+
+    async def fake_redis_get(key: str):
+        nonlocal reads
+        reads += 1
+        await asyncio.sleep(0.01)
+        return {"sub": "user_123"}
+
+    monkeypatch.setattr(zitadel_module, "_get_redis_json", fake_redis_get)
+
+    await asyncio.gather(*(auth.get_userinfo("token-123") for _ in range(5)))
+
+    assert reads == 1
+
+
+@pytest.mark.asyncio
+async def test_get_userinfo_caches_by_token_hash():
+    auth = ZitadelAuth(settings=SimpleNamespace(userinfo_uri="https://example.com/userinfo"))
+
+    async def fake_fetch(token: str, token_key: str):
+        auth._userinfo_cache[token_key] = {"sub": "user_123"}
+        return auth._userinfo_cache[token_key]
+
+    auth._fetch_userinfo = fake_fetch
+
+    await auth.get_userinfo("token-123")
+
+    assert "token-123" not in auth._userinfo_cache
+    assert _token_cache_key("token-123", auth._userinfo_uri) in auth._userinfo_cache
+
+
+def test_token_cache_key_is_scoped_to_userinfo_uri():
+    assert _token_cache_key("token-123", "https://a.example.com/userinfo") != _token_cache_key(
+        "token-123", "https://b.example.com/userinfo"
+    )
+
+
 @pytest.mark.asyncio
 async def test_get_current_active_analytics_user_uses_cached_snapshot(monkeypatch):
     user = ZitadelUser(sub="user_123", email="user@example.com")
@@ -57,10 +100,269 @@ async def test_get_current_active_analytics_user_uses_cached_snapshot(monkeypatc
         "updated_at": None,
         "last_login_at": None,
     }
-    monkeypatch.setattr(zitadel_module, "_auth_instance", auth)
+    monkeypatch.setattr(zitadel_module, "get_auth", lambda: auth)
 
     current_user = await get_current_active_analytics_user(user=user, db=db)
 
     assert current_user["user"].user_id == "user_123"
     assert current_user["db_user"].user_id == "user_123"
     db.query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_active_user_snapshot_skips_redis_write(monkeypatch):
+    from app.auth import zitadel as zitadel_module
+
+    auth = ZitadelAuth(settings=SimpleNamespace(userinfo_uri="https://example.com/userinfo"))
+    monkeypatch.setattr(zitadel_module, "get_auth", lambda: auth)
+    writes = []
+
+    async def fake_redis_set(key: str, payload: dict, ttl: int):
+        writes.append(key)
+
+    monkeypatch.setattr(zitadel_module, "_set_redis_json", fake_redis_set)
+    db_user = SimpleNamespace(
+        user_id="user_123",
+        email="user@example.com",
+        full_name="Test User",
+        avatar_url=None,
+        is_active=True,
+        is_verified=True,
+        role="user",
+        oauth_provider="zitadel",
+        oauth_id="user_123",
+        created_at=None,
+        updated_at=None,
+        last_login_at=None,
+    )
+
+    await zitadel_module._cache_active_user_snapshot("user_123", db_user)
+    await zitadel_module._cache_active_user_snapshot("user_123", db_user)
+
+    assert len(writes) == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_active_user_cache_drops_snapshot(monkeypatch):
+    from app.auth import zitadel as zitadel_module
+
+    auth = ZitadelAuth(settings=SimpleNamespace(userinfo_uri="https://example.com/userinfo"))
+    auth._active_user_cache["user_123"] = {"user_id": "user_123", "is_active": True}
+    monkeypatch.setattr(zitadel_module, "get_auth", lambda: auth)
+    redis = Mock()
+
+    async def fake_delete(key: str):
+        redis.deleted = key
+        return True
+
+    redis.delete = fake_delete
+    monkeypatch.setattr(zitadel_module, "get_redis_cache", lambda: redis)
+
+    await zitadel_module.invalidate_active_user_cache("user_123")
+
+    assert "user_123" not in auth._active_user_cache
+    assert redis.deleted == "auth:active-user:user_123"
+
+
+@pytest.mark.asyncio
+async def test_get_optional_user_ignores_short_tokens(monkeypatch):
+    from app.auth import zitadel as zitadel_module
+
+    def fail_get_auth():
+        raise AssertionError("auth path should not be entered")
+
+    monkeypatch.setattr(zitadel_module, "get_auth", fail_get_auth)
+    credentials = SimpleNamespace(credentials="undefined")
+
+    assert await zitadel_module.get_optional_user(credentials=credentials) is None
+
+
+def test_userinfo_ttl_is_capped_by_token_expiry():
+    import time
+
+    from app.auth.zitadel import USERINFO_CACHE_TTL_SECONDS, _userinfo_ttl
+
+    assert _userinfo_ttl({"sub": "user_123"}) == USERINFO_CACHE_TTL_SECONDS
+    assert _userinfo_ttl({"exp": time.time() + 30}) <= 30
+    assert _userinfo_ttl({"exp": time.time() + 3600}) == USERINFO_CACHE_TTL_SECONDS
+    assert _userinfo_ttl({"exp": time.time() - 10}) == 1.0
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_is_not_sent_upstream_again(monkeypatch):
+    from fastapi import HTTPException
+
+    from app.auth import zitadel as zitadel_module
+
+    auth = ZitadelAuth(settings=SimpleNamespace(userinfo_uri="https://example.com/userinfo"))
+    calls = 0
+
+    async def fake_get(url, headers):
+        nonlocal calls
+        calls += 1
+        return SimpleNamespace(status_code=401)
+
+    async def fake_client():
+        return SimpleNamespace(get=fake_get)
+
+    async def no_redis(key: str):
+        return None
+
+    monkeypatch.setattr(zitadel_module, "get_http_client", fake_client)
+    monkeypatch.setattr(zitadel_module, "_get_redis_json", no_redis)
+
+    for _ in range(3):
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.get_userinfo("bad-token-123456789012")
+        assert exc_info.value.status_code == 401
+
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_fetched_userinfo_is_projected_before_caching(monkeypatch):
+    from app.auth import zitadel as zitadel_module
+
+    auth = ZitadelAuth(settings=SimpleNamespace(userinfo_uri="https://example.com/userinfo"))
+
+    async def fake_get(url, headers):
+        return SimpleNamespace(
+            status_code=200,
+            content=b'{"sub": "user_123", "email": "user@example.com", "groups": ["a", "b"]}',
+        )
+
+    async def fake_client():
+        return SimpleNamespace(get=fake_get)
+
+    async def no_redis_write(key: str, payload: dict, ttl: int):
+        return None
+
+    monkeypatch.setattr(zitadel_module, "get_http_client", fake_client)
+    monkeypatch.setattr(zitadel_module, "_set_redis_json", no_redis_write)
+
+    token_key = _token_cache_key("token-123", auth._userinfo_uri)
+    result = await auth._fetch_userinfo("token-123", token_key)
+
+    assert result == {"sub": "user_123", "email": "user@example.com"}
+    assert auth._userinfo_cache[token_key] == result
+
+
+@pytest.mark.asyncio
+async def test_stale_userinfo_is_served_and_refreshed_in_background():
+    auth = ZitadelAuth(settings=SimpleNamespace(userinfo_uri="https://example.com/userinfo"))
+    token_key = _token_cache_key("token-123", auth._userinfo_uri)
+    auth._userinfo_cache[token_key] = {"sub": "user_123"}
+    refreshed = asyncio.Event()
+
+    async def fake_fetch(token: str, token_key: str):
+        refreshed.set()
+        return {"sub": "user_123"}
+
+    auth._fetch_userinfo = fake_fetch
+
+    results = [await auth.get_userinfo("token-123") for _ in range(3)]
+    await asyncio.wait_for(refreshed.wait(), timeout=1)
+
+    assert all(result["sub"] == "user_123" for result in results)
+    assert token_key in auth._userinfo_fresh
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_drops_revoked_token(monkeypatch):
+    from fastapi import HTTPException
+
+    from app.auth import zitadel as zitadel_module
+
+    auth = ZitadelAuth(settings=SimpleNamespace(userinfo_uri="https://example.com/userinfo"))
+    token_key = _token_cache_key("token-123", auth._userinfo_uri)
+    auth._userinfo_cache[token_key] = {"sub": "user_123"}
+    deleted = []
+
+    async def fake_fetch(token: str, token_key: str):
+        auth._invalid_token_cache[token_key] = True
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+    async def fake_delete(key: str):
+        deleted.append(key)
+
+    auth._fetch_userinfo = fake_fetch
+    monkeypatch.setattr(zitadel_module, "_delete_redis_key", fake_delete)
+
+    await auth._refresh_userinfo("token-123", token_key)
+
+    assert token_key not in auth._userinfo_cache
+    assert deleted == [f"auth:userinfo:{token_key}"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_userinfo_is_not_negative_cached(monkeypatch):
+    from fastapi import HTTPException
+
+    from app.auth import zitadel as zitadel_module
+
+    auth = ZitadelAuth(settings=SimpleNamespace(userinfo_uri="https://example.com/userinfo"))
+    token_key = _token_cache_key("token-123", auth._userinfo_uri)
+    auth._userinfo_cache[token_key] = {"sub": "user_123"}
+    deleted = []
+
+    async def fake_get(url, headers):
+        return SimpleNamespace(status_code=429, text="rate limited")
+
+    async def fake_client():
+        return SimpleNamespace(get=fake_get)
+
+    async def fake_delete(key: str):
+        deleted.append(key)
+
+    monkeypatch.setattr(zitadel_module, "get_http_client", fake_client)
+    monkeypatch.setattr(zitadel_module, "_delete_redis_key", fake_delete)
+
+    with pytest.raises(HTTPException):
+        await auth._fetch_userinfo("token-123", token_key)
+    await auth._refresh_userinfo("token-123", token_key)
+
+    assert token_key not in auth._invalid_token_cache
+    assert auth._userinfo_cache[token_key] == {"sub": "user_123"}
+    assert deleted == []
+
+
+@pytest.mark.parametrize("claims", [{"sub": "user_123"}, {"sub": "user_123", "email": None}])
+def test_user_from_claims_without_email(claims):
+    user = ZitadelUser.from_claims(claims)
+
+    assert user.display_name == ""
+    assert user.full_name == ""
+
+
+def test_sync_db_user_buffers_last_login_without_commit(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    from app.adapters.database.postgres.models import UserTable
+    from app.auth import zitadel as zitadel_module
+
+    last_login = datetime.now(timezone.utc) - timedelta(hours=1)
+    db_user = UserTable(
+        user_id="user_123",
+        email="user@example.com",
+        full_name="Test User",
+        is_verified=True,
+        last_login_at=last_login,
+    )
+    db = Mock()
+    db.get.return_value = db_user
+    db.query.return_value.scalar.return_value = True
+    recorded = []
+    monkeypatch.setattr(zitadel_module.login_buffer, "record", lambda key, at: recorded.append(key))
+
+    user = ZitadelUser(
+        sub="user_123",
+        email="user@example.com",
+        email_verified=True,
+        name="Test User",
+    )
+    assert zitadel_module._sync_db_user(db, user) is db_user
+
+    assert recorded == ["user_123"]
+    assert db_user.last_login_at == last_login
+    db.add.assert_not_called()
+    db.commit.assert_not_called()
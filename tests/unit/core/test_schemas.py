@@ -0,0 +1,28 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+"""
+Unit tests for shared schema types.
+"""
+
+from datetime import datetime, timezone
+
+from app.core.schemas.logs import LogFilterRequest
+
+
+class TestUTCDatetime:
+    """Test suite for UTC datetime normalisation."""
+
+    def test_parsed_datetime_uses_stdlib_utc(self):
+        """Test that parsed offsets are re-tagged with timezone.utc."""
+        filters = LogFilterRequest(start_date="2025-01-24T11:00:00+02:00")
+
+        assert filters.start_date.tzinfo is timezone.utc
+        assert filters.start_date == datetime(2025, 1, 24, 9, tzinfo=timezone.utc)
+
+    def test_naive_datetime_is_unchanged(self):
+        """Test that naive values are not shifted to local time."""
+        filters = LogFilterRequest(end_date=datetime(2025, 1, 24, 9))
+
+        assert filters.end_date == datetime(2025, 1, 24, 9)
+        assert filters.end_date.tzinfo is None
@@ -358,3 +358,21 @@ class TestAnalyticsService:
         # Should still create buckets, just empty
         assert len(buckets) >= 1
         assert all(len(bucket) == 0 for bucket in buckets.values())
+
+    def test_group_by_period_bucket_boundaries(self, service):
+        """Test that items land in the bucket whose start they fall on or after."""
+        start_date = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        end_date = start_date + timedelta(days=2)
+        on_boundary = Mock(created_at=start_date + timedelta(days=1))
+        before_start = Mock(created_at=start_date - timedelta(seconds=1))
+        after_last = Mock(created_at=end_date + timedelta(days=1))
+
+        buckets = service._group_by_period(
+            items=[on_boundary, before_start, after_last],
+            start_date=start_date,
+            end_date=end_date,
+            period="day",
+        )
+
+        assert buckets[start_date + timedelta(days=1)] == [on_boundary]
+        assert sum(len(bucket) for bucket in buckets.values()) == 1
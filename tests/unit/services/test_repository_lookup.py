@@ -0,0 +1,71 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+"""
+Unit tests for the webhook repository connection lookup cache.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from app.services.webhook import repository_lookup
+from app.services.webhook.repository_lookup import (
+    RepositoryConnectionSnapshot,
+    get_repository_connection_snapshot,
+    invalidate_repository_connection,
+)
+
+
+class TestRepositoryLookup:
+    """Test suite for the repository connection snapshot cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty cache."""
+        repository_lookup._repo_conn_cache.clear()
+        yield
+        repository_lookup._repo_conn_cache.clear()
+
+    @pytest.fixture
+    def repo_conn_row(self):
+        """Create the narrow row returned by the lookup query."""
+        return ("rpc_123", "user_123", "github", "owner/repo", "encrypted", True, False)
+
+    @pytest.fixture
+    def mock_db(self, repo_conn_row):
+        """Create mock database session returning the connection row."""
+        db = MagicMock()
+        db.execute.return_value.first.return_value = repo_conn_row
+        return db
+
+    def test_returns_detached_snapshot(self, mock_db):
+        """Test that lookups return a snapshot rather than the ORM row."""
+        snapshot = get_repository_connection_snapshot(mock_db, "github", "owner/repo")
+
+        assert isinstance(snapshot, RepositoryConnectionSnapshot)
+        assert snapshot.id == "rpc_123"
+        assert snapshot.webhook_secret == "encrypted"
+        assert snapshot.auto_pr_enabled is False
+
+    def test_second_lookup_skips_database(self, mock_db):
+        """Test that a cached connection is served without querying."""
+        get_repository_connection_snapshot(mock_db, "github", "owner/repo")
+        get_repository_connection_snapshot(mock_db, "github", "owner/repo")
+
+        assert mock_db.execute.call_count == 1
+
+    def test_unknown_repository_is_not_cached(self, mock_db):
+        """Test that misses always go back to the database."""
+        mock_db.execute.return_value.first.return_value = None
+
+        assert get_repository_connection_snapshot(mock_db, "github", "owner/missing") is None
+        assert get_repository_connection_snapshot(mock_db, "github", "owner/missing") is None
+        assert mock_db.execute.call_count == 2
+
+    def test_invalidate_forces_reload(self, mock_db):
+        """Test that invalidation drops the cached snapshot."""
+        get_repository_connection_snapshot(mock_db, "github", "owner/repo")
+        invalidate_repository_connection("github", "owner/repo")
+        get_repository_connection_snapshot(mock_db, "github", "owner/repo")
+
+        assert mock_db.execute.call_count == 2
@@ -207,7 +207,7 @@ class TestTokenManager:
         mock_connection.provider = "github"
         mock_connection.is_active = True
 
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_connection
+        mock_db.execute.return_value.scalars.return_value.first.return_value = mock_connection
 
         connection = await token_manager.get_oauth_connection(
             db=mock_db,
@@ -225,7 +225,7 @@ class TestTokenManager:
     async def test_get_oauth_connection_not_found(self, token_manager, mock_db):
         """Test getting a non-existent OAuth connection."""
         # Mock database query to return None
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_db.execute.return_value.scalars.return_value.first.return_value = None
 
         connection = await token_manager.get_oauth_connection(
             db=mock_db,
@@ -251,6 +251,23 @@ class TestTokenManager:
 
         assert decrypted == plaintext_token
 
+    def test_get_decrypted_token_is_cached(self, token_manager):
+        """Test that repeated lookups of the same stored token decrypt once."""
+        from app.adapters.database.postgres.models import OAuthConnectionTable
+
+        mock_connection = Mock(spec=OAuthConnectionTable)
+        mock_connection.access_token = token_manager.encrypt_token("my_access_token")
+
+        with patch.object(token_manager, "decrypt_token", wraps=token_manager.decrypt_token) as decrypt:
+            assert token_manager.get_decrypted_token(mock_connection) == "my_access_token"
+            assert token_manager.get_decrypted_token(mock_connection) == "my_access_token"
+
+            # A rotated token has new ciphertext and is decrypted afresh
+            mock_connection.access_token = token_manager.encrypt_token("rotated_token")
+            assert token_manager.get_decrypted_token(mock_connection) == "rotated_token"
+
+        assert decrypt.call_count == 2
+
     @pytest.mark.asyncio
     async def test_revoke_oauth_connection_success(self, token_manager, mock_db):
         """Test successful OAuth connection revocation."""
@@ -361,6 +361,18 @@ class TestWebhookManager:
 
         assert result is False
 
+    def test_verify_github_signature_non_hex_digest(self):
+        """Test that a well-prefixed but non-hex signature is rejected."""
+        payload = b'{"action": "completed"}'
+
+        result = WebhookManager.verify_github_signature(
+            payload=payload,
+            signature="sha256=" + "zz" * 32,
+            secret="my_webhook_secret",
+        )
+
+        assert result is False
+
     def test_verify_github_signature_wrong_format(self):
         """Test GitHub signature verification with wrong format."""
         payload = b'{"action": "completed"}'
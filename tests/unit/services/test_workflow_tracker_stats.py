@@ -0,0 +1,51 @@
+# Copyright (c) 2025 Parth Sinha and Shine Gupta. All rights reserved.
+# DevFlowFix - Autonomous AI agent that detects, analyzes, and resolves CI/CD failures in real-time.
+
+"""
+Unit tests for WorkflowTracker run statistics.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from app.services.workflow.workflow_tracker import WorkflowTracker
+
+
+class TestWorkflowRunStats:
+    """Test suite for WorkflowTracker.get_workflow_run_stats."""
+
+    @pytest.fixture
+    def tracker(self):
+        """Create WorkflowTracker instance for testing."""
+        return WorkflowTracker(token_manager=MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_stats_come_from_one_aggregate_query(self, tracker):
+        """Test that all statistics are read from a single result row."""
+        db = MagicMock()
+        db.execute.return_value.one.return_value = (10, 2, 7, 1, 8, Decimal("12.5"), 3)
+
+        stats = await tracker.get_workflow_run_stats(db=db, user_id="user_123")
+
+        assert db.execute.call_count == 1
+        assert stats == {
+            "total_runs": 10,
+            "failed_runs": 2,
+            "successful_runs": 7,
+            "in_progress_runs": 1,
+            "avg_duration_seconds": 12.5,
+            "failure_rate": 25.0,
+            "repositories_tracked": 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_no_completed_runs(self, tracker):
+        """Test that empty results yield a zero failure rate and no average."""
+        db = MagicMock()
+        db.execute.return_value.one.return_value = (0, 0, 0, 0, 0, None, 0)
+
+        stats = await tracker.get_workflow_run_stats(db=db, user_id="user_123")
+
+        assert stats["failure_rate"] == 0.0
+        assert stats["avg_duration_seconds"] is None